@@ -2,67 +2,132 @@
 FastAPI application - Main API entry point
 """
 
-from fastapi import FastAPI, HTTPException, BackgroundTasks
-from fastapi.middleware.cors import CORSMiddleware
+from fastapi import FastAPI, HTTPException, BackgroundTasks, Response
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 from contextlib import asynccontextmanager
+from functools import lru_cache
+from logging.handlers import QueueHandler, QueueListener
 import logging
+import queue
 
-from ..config import settings
+import orjson
+
+from ..config import Settings, settings
+from .middleware import FastCORSMiddleware
 from .routers import interviews, call_guides, analytics, health, quality_dashboard
 
-# Configure logging
-logging.basicConfig(
-    level=getattr(logging, settings.log_level),
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+@lru_cache(maxsize=None)
+def _log_level(name: str) -> int:
+    """Resolve a logging level name to its numeric value"""
+    return getattr(logging, name)
+
+
+# Configure logging: handlers only enqueue records, a background listener
+# thread owns the stream so the event loop never blocks on stderr writes.
+# The queue is unbounded so a slow listener never makes logging raise.
+log_queue: queue.Queue = queue.Queue()
+queue_handler = QueueHandler(log_queue)
+stream_handler = logging.StreamHandler()
+stream_handler.setFormatter(
+    logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 )
+log_listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+
+root_logger = logging.getLogger()
+if settings.app_env == "production":
+    root_logger.setLevel(logging.WARNING)
+else:
+    root_logger.setLevel(_log_level(settings.log_level))
+
+# Write directly until the lifespan starts the listener, so imports that never
+# run it (scripts, tests) still get formatted output at the configured level
+root_logger.addHandler(stream_handler)
+
 logger = logging.getLogger(__name__)
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Startup and shutdown logic"""
+    # Only enqueue while the listener is draining the queue
+    log_listener.start()
+    root_logger.removeHandler(stream_handler)
+    root_logger.addHandler(queue_handler)
     logger.info("Starting Expert Interviewers API")
     logger.info(f"Environment: {settings.app_env}")
     yield
     logger.info("Shutting down Expert Interviewers API")
+    root_logger.removeHandler(queue_handler)
+    log_listener.stop()
+    root_logger.addHandler(stream_handler)
 
 
-# Create FastAPI app
-app = FastAPI(
-    title="Expert Interviewers API",
-    description="Autonomous Voice Research Interview System",
-    version="0.1.0",
-    docs_url="/docs",
-    redoc_url="/redoc",
-    lifespan=lifespan
-)
-
-# CORS configuration
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],  # Configure appropriately for production
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
-
-# Include routers
-app.include_router(health.router, prefix="/api/health", tags=["Health"])
-app.include_router(call_guides.router, prefix="/api/call-guides", tags=["Call Guides"])
-app.include_router(interviews.router, prefix="/api/interviews", tags=["Interviews"])
-app.include_router(analytics.router, prefix="/api/analytics", tags=["Analytics"])
-app.include_router(quality_dashboard.router, prefix="/api", tags=["Quality Dashboard"])
+# Root payload never changes, so serialize it once at import
+_ROOT_BODY = orjson.dumps({
+    "service": "Expert Interviewers",
+    "version": "0.1.0",
+    "status": "running",
+    "docs": "/docs"
+})
 
 
-@app.get("/")
 async def root():
     """Root endpoint"""
-    return {
-        "service": "Expert Interviewers",
-        "version": "0.1.0",
-        "status": "running",
-        "docs": "/docs"
-    }
+    return Response(content=_ROOT_BODY, media_type="application/json")
+
+
+def create_app(app_settings: Settings) -> FastAPI:
+    """
+    Build the API application
+
+    Each router and middleware is registered exactly once.
+
+    Args:
+        app_settings: Application settings
+
+    Returns:
+        Configured FastAPI application
+    """
+    application = FastAPI(
+        title="Expert Interviewers API",
+        description="Autonomous Voice Research Interview System",
+        version="0.1.0",
+        docs_url="/docs",
+        redoc_url="/redoc",
+        default_response_class=ORJSONResponse,
+        lifespan=lifespan
+    )
+
+    # CORS configuration (wildcard origins - configure appropriately for production)
+    application.add_middleware(FastCORSMiddleware, exclude_paths=("/api/health",))
+
+    # Compress bulky dashboard payloads; probes and root stay under the threshold.
+    # Level 4 keeps most of the ratio on JSON at a fraction of level 9's CPU
+    application.add_middleware(GZipMiddleware, minimum_size=512, compresslevel=4)
+
+    # Health probes get their own bare sub-app: no docs, no CORS header work
+    health_app = FastAPI(
+        docs_url=None,
+        redoc_url=None,
+        openapi_url=None,
+        default_response_class=ORJSONResponse
+    )
+    health_app.include_router(health.router)
+    application.mount("/api/health", health_app)
+
+    # Include routers
+    application.include_router(call_guides.router, prefix="/api/call-guides", tags=["Call Guides"])
+    application.include_router(interviews.router, prefix="/api/interviews", tags=["Interviews"])
+    application.include_router(analytics.router, prefix="/api/analytics", tags=["Analytics"])
+    application.include_router(quality_dashboard.router, prefix="/api", tags=["Quality Dashboard"])
+
+    application.add_api_route("/", root, methods=["GET"])
+
+    return application
+
+
+app = create_app(settings)
 
 
 if __name__ == "__main__":
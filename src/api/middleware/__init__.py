@@ -0,0 +1,9 @@
+"""
+API middleware
+"""
+
+from .cors import FastCORSMiddleware
+
+__all__ = [
+    "FastCORSMiddleware",
+]
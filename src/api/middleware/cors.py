@@ -0,0 +1,136 @@
+"""
+Pure-ASGI CORS middleware
+
+Behaves like Starlette's CORSMiddleware configured with wildcard origins,
+methods and headers, but encodes every header value once at startup so the
+per-request path only inspects the scope and appends pre-built tuples.
+"""
+
+from typing import List, Optional, Sequence, Tuple
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+class FastCORSMiddleware:
+    """Wildcard CORS middleware with pre-encoded response headers"""
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        allow_credentials: bool = True,
+        max_age: int = 600,
+        exclude_paths: Sequence[str] = (),
+    ):
+        """
+        Initialize CORS middleware
+
+        Args:
+            app: Downstream ASGI application
+            allow_credentials: Whether credentialed requests are allowed
+            max_age: Seconds browsers may cache a preflight response
+            exclude_paths: Path prefixes passed straight through (e.g. probes)
+        """
+        self.app = app
+        self.allow_credentials = allow_credentials
+        self.exclude_paths = tuple(exclude_paths)
+
+        self._allow_origin = b"*"
+        self._allow_methods = b"GET, POST, PUT, DELETE, OPTIONS, PATCH"
+        self._allow_headers = b"*"
+        self._max_age = str(max_age).encode("latin-1")
+
+        self._simple_headers: List[Tuple[bytes, bytes]] = [
+            (b"access-control-allow-origin", self._allow_origin),
+        ]
+        self._preflight_headers: List[Tuple[bytes, bytes]] = [
+            (b"access-control-allow-methods", self._allow_methods),
+            (b"access-control-max-age", self._max_age),
+            (b"content-type", b"text/plain; charset=utf-8"),
+            (b"content-length", b"2"),
+        ]
+        if allow_credentials:
+            self._credentials_header = (b"access-control-allow-credentials", b"true")
+            self._simple_headers.append(self._credentials_header)
+            self._preflight_headers.append(self._credentials_header)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"].startswith(self.exclude_paths):
+            await self.app(scope, receive, send)
+            return
+
+        origin: Optional[bytes] = None
+        request_method: Optional[bytes] = None
+        request_headers: Optional[bytes] = None
+        has_cookie = False
+        for name, value in scope["headers"]:
+            if name == b"origin":
+                origin = value
+            elif name == b"access-control-request-method":
+                request_method = value
+            elif name == b"access-control-request-headers":
+                request_headers = value
+            elif name == b"cookie":
+                has_cookie = True
+
+        # Not a cross-origin request: nothing to add
+        if origin is None:
+            await self.app(scope, receive, send)
+            return
+
+        if scope["method"] == "OPTIONS" and request_method is not None:
+            await self._preflight(origin, request_headers, send)
+            return
+
+        await self._simple(scope, receive, send, origin, has_cookie)
+
+    async def _preflight(
+        self,
+        origin: bytes,
+        request_headers: Optional[bytes],
+        send: Send
+    ) -> None:
+        """Answer a preflight request without invoking the downstream app"""
+        # Browsers ignore "*" on credentialed requests, so echo the origin
+        # and requested headers back as Starlette does for wildcard configs
+        if self.allow_credentials:
+            headers = [
+                (b"access-control-allow-origin", origin),
+                (b"vary", b"Origin"),
+            ]
+        else:
+            headers = [(b"access-control-allow-origin", self._allow_origin)]
+
+        headers.append((
+            b"access-control-allow-headers",
+            request_headers if request_headers else self._allow_headers
+        ))
+        headers.extend(self._preflight_headers)
+
+        await send({"type": "http.response.start", "status": 200, "headers": headers})
+        await send({"type": "http.response.body", "body": b"OK"})
+
+    async def _simple(
+        self,
+        scope: Scope,
+        receive: Receive,
+        send: Send,
+        origin: bytes,
+        has_cookie: bool
+    ) -> None:
+        """Forward a simple request, injecting CORS headers into the response"""
+        if self.allow_credentials and has_cookie:
+            cors_headers = [
+                (b"access-control-allow-origin", origin),
+                (b"vary", b"Origin"),
+                self._credentials_header,
+            ]
+        else:
+            cors_headers = self._simple_headers
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message.setdefault("headers", [])
+                message["headers"] = list(message["headers"]) + cors_headers
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
@@ -5,13 +5,15 @@ Analytics and insights endpoints
 from fastapi import APIRouter, HTTPException, status
 from typing import List, Optional
 from pydantic import BaseModel
+from cachetools import LRUCache
 
+from ...config import settings
 from ...models.analytics import InsightExtraction
 
 router = APIRouter()
 
 # In-memory storage for demo
-insights_db = {}
+insights_db: LRUCache = LRUCache(maxsize=settings.insight_cache_size)
 
 
 class GenerateInsightsRequest(BaseModel):
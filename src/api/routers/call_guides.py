@@ -2,16 +2,19 @@
 Call Guide management endpoints
 """
 
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, HTTPException, Query, status
 from typing import List
 from datetime import datetime
+from itertools import islice
+from cachetools import LRUCache
 
+from ...config import settings
 from ...models.call_guide import CallGuide
 
 router = APIRouter()
 
 # In-memory storage for demo (replace with database in production)
-call_guides_db = {}
+call_guides_db: LRUCache = LRUCache(maxsize=settings.call_guide_cache_size)
 
 
 @router.post("/", response_model=CallGuide, status_code=status.HTTP_201_CREATED)
@@ -33,9 +36,11 @@ async def get_call_guide(guide_id: str) -> CallGuide:
 
 
 @router.get("/", response_model=List[CallGuide])
-async def list_call_guides() -> List[CallGuide]:
-    """List all call guides"""
-    return list(call_guides_db.values())
+async def list_call_guides(
+    limit: int = Query(default=100, ge=1, le=1000)
+) -> List[CallGuide]:
+    """List call guides"""
+    return tuple(islice(call_guides_db.values(), limit))
 
 
 @router.put("/{guide_id}", response_model=CallGuide)
@@ -2,26 +2,65 @@
 Health check endpoints
 """
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Response
 from datetime import datetime
-from typing import Dict, Any
+from typing import Callable, Dict, Any, Tuple
+import time
+
+import orjson
 
 router = APIRouter()
 
+# Probe timestamps only need coarse resolution
+_CLOCK_RESOLUTION_SECONDS = 0.1
+_now_cache: Tuple[float, datetime] = (0.0, datetime.min)
+
+# Serialized probe bodies, rebuilt only when the coarse clock ticks
+_body_cache: Dict[str, Tuple[datetime, bytes]] = {}
+
+
+def now_utc() -> datetime:
+    """Current UTC time, reused for up to 100ms between probes"""
+    global _now_cache
+    expires_at, now = _now_cache
+    tick = time.monotonic()
+    if tick >= expires_at:
+        now = datetime.utcnow()
+        _now_cache = (tick + _CLOCK_RESOLUTION_SECONDS, now)
+    return now
+
+
+def _probe_response(name: str, build: Callable[[datetime], Dict[str, Any]]) -> Response:
+    """
+    Return a probe payload, serializing it at most once per clock tick
+
+    Args:
+        name: Cache key for the probe
+        build: Builds the payload for a given timestamp
+
+    Returns:
+        JSON response with the pre-serialized body
+    """
+    now = now_utc()
+    cached = _body_cache.get(name)
+    if cached is None or cached[0] is not now:
+        cached = (now, orjson.dumps(build(now)))
+        _body_cache[name] = cached
+    return Response(content=cached[1], media_type="application/json")
+
 
 @router.get("/")
-async def health_check() -> Dict[str, Any]:
+async def health_check() -> Response:
     """Basic health check"""
-    return {
+    return _probe_response("health", lambda now: {
         "status": "healthy",
-        "timestamp": datetime.utcnow().isoformat(),
+        "timestamp": now,
         "service": "Expert Interviewers"
-    }
+    })
 
 
-@router.get("/ready")
-async def readiness_check() -> Dict[str, Any]:
-    """Readiness check - verify all dependencies are available"""
+def _readiness_payload(now: datetime) -> Dict[str, Any]:
+    """Build the readiness payload"""
     checks = {
         "api": "healthy",
         # Add checks for:
@@ -35,14 +74,20 @@ async def readiness_check() -> Dict[str, Any]:
     return {
         "ready": all_healthy,
         "checks": checks,
-        "timestamp": datetime.utcnow().isoformat()
+        "timestamp": now
     }
 
 
+@router.get("/ready")
+async def readiness_check() -> Response:
+    """Readiness check - verify all dependencies are available"""
+    return _probe_response("ready", _readiness_payload)
+
+
 @router.get("/live")
-async def liveness_check() -> Dict[str, str]:
+async def liveness_check() -> Response:
     """Liveness check"""
-    return {
+    return _probe_response("live", lambda now: {
         "status": "alive",
-        "timestamp": datetime.utcnow().isoformat()
-    }
+        "timestamp": now
+    })
@@ -4,15 +4,18 @@ Interview management endpoints
 
 from fastapi import APIRouter, HTTPException, BackgroundTasks, status
 from typing import List, Optional
+from itertools import islice
 from pydantic import BaseModel
+from cachetools import LRUCache
 
+from ...config import settings
 from ...models.interview import Interview, InterviewStatus
 from ...models.call_guide import CallGuide
 
 router = APIRouter()
 
 # In-memory storage for demo
-interviews_db = {}
+interviews_db: LRUCache = LRUCache(maxsize=settings.interview_cache_size)
 
 
 class ScheduleInterviewRequest(BaseModel):
@@ -83,12 +86,12 @@ async def list_interviews(
     limit: int = 50
 ) -> List[Interview]:
     """List interviews with optional filtering"""
-    interviews = list(interviews_db.values())
+    interviews = interviews_db.values()
 
     if status:
-        interviews = [i for i in interviews if i.status == status]
+        interviews = (i for i in interviews if i.status == status)
 
-    return interviews[:limit]
+    return list(islice(interviews, limit))
 
 
 @router.get("/{interview_id}/transcript")
@@ -1,14 +1,28 @@
 """
 Quality Dashboard API Router
 Endpoints for quality monitoring and dashboard
+
+Idempotent GET endpoints send Cache-Control and ETag headers. A CDN or
+reverse proxy (e.g. a Cloudflare cache rule on /api/quality/*) can then
+serve repeat polls without reaching the application.
 """
 
-from fastapi import APIRouter, HTTPException, Query, Depends
-from typing import List, Optional
+from fastapi import APIRouter, HTTPException, Query, Depends, Request, Response
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence, Tuple
 from datetime import datetime, timedelta
 from pydantic import BaseModel
+from cachetools import TTLCache
+from operator import attrgetter
+import asyncio
+import hashlib
+import heapq
+import numpy as np
+import orjson
 
 from ...monitoring.quality_monitor import (
+    STATUS_COMPLETED,
+    STATUS_FAILED,
     QualityMonitor,
     QualityAlert,
     QualityReport,
@@ -18,20 +32,208 @@ from ...monitoring.quality_monitor import (
     MetricStatus
 )
 
-router = APIRouter(prefix="/quality", tags=["quality-dashboard"])
+# Endpoints build plain dicts and return ORJSONResponse directly, skipping
+# jsonable_encoder and response_model validation; the Pydantic models below
+# only document the response shapes in OpenAPI
+router = APIRouter(
+    prefix="/quality",
+    tags=["quality-dashboard"],
+    default_response_class=ORJSONResponse
+)
 
-# Global quality monitor instance (in production, this should be properly managed)
-_quality_monitor: Optional[QualityMonitor] = None
+# Global quality monitor instance, created once at import so the per-request
+# dependency is a plain read (in production, this should be properly managed)
+_quality_monitor = QualityMonitor()
 
 
 def get_quality_monitor() -> QualityMonitor:
-    """Get or create quality monitor instance"""
-    global _quality_monitor
-    if _quality_monitor is None:
-        _quality_monitor = QualityMonitor()
+    """Get the quality monitor instance"""
     return _quality_monitor
 
 
+# Serialized statistics keyed by time window: (body, etag)
+_statistics_cache: TTLCache = TTLCache(maxsize=512, ttl=30)
+
+
+# Generated reports keyed by ("report", hours); /health polls use a shorter TTL
+_report_cache: TTLCache = TTLCache(maxsize=64, ttl=5)
+_health_report_cache: TTLCache = TTLCache(maxsize=4, ttl=2)
+_report_lock = asyncio.Lock()
+_report_cache_stats: Dict[str, int] = {"hits": 0, "misses": 0}
+
+
+async def _cached_report(
+    monitor: QualityMonitor,
+    hours: float,
+    cache: TTLCache
+) -> QualityReport:
+    """
+    Return a recent report for the window, generating it at most once per TTL
+
+    Args:
+        monitor: Quality monitor
+        hours: Time window in hours
+        cache: TTL cache to read and fill
+
+    Returns:
+        Quality report
+    """
+    key = ("report", hours)
+    report = cache.get(key)
+    if report is None:
+        # Only one coroutine regenerates on a miss; the rest reuse its result
+        async with _report_lock:
+            report = cache.get(key)
+            if report is None:
+                _report_cache_stats["misses"] += 1
+                report = await monitor.generate_report(timedelta(hours=hours))
+                cache[key] = report
+                return report
+
+    _report_cache_stats["hits"] += 1
+    return report
+
+
+def _invalidate_reports():
+    """Drop cached reports after alert or threshold changes"""
+    _report_cache.clear()
+    _health_report_cache.clear()
+
+
+# Serialized thresholds response (body, etag), rebuilt after a threshold PUT
+_thresholds_body: Optional[Tuple[bytes, str]] = None
+
+
+def _get_thresholds_body(monitor: QualityMonitor) -> Tuple[bytes, str]:
+    """Get the serialized thresholds response, encoding it on first use"""
+    global _thresholds_body
+    if _thresholds_body is None:
+        body = orjson.dumps([
+            {
+                "metric_name": t.metric_name,
+                "warning_threshold": t.warning_threshold,
+                "error_threshold": t.error_threshold,
+                "critical_threshold": t.critical_threshold,
+                "comparison": t.comparison,
+                "window_size": t.window_size,
+                "enabled": t.enabled
+            }
+            for t in monitor.thresholds
+        ])
+        _thresholds_body = (body, _etag_for(body))
+    return _thresholds_body
+
+
+def _invalidate_thresholds():
+    """Drop the cached thresholds response and reports derived from them"""
+    global _thresholds_body
+    _thresholds_body = None
+    _invalidate_reports()
+
+
+def _etag_for(body: bytes) -> str:
+    """Compute a strong ETag for a serialized response body"""
+    return f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+
+
+# Cache-Control policies for idempotent GET endpoints
+_DASHBOARD_CACHE_CONTROL = "public, max-age=5, stale-while-revalidate=10"
+_CONFIG_CACHE_CONTROL = "public, max-age=30"
+_SERIES_CACHE_CONTROL = "public, max-age=2"
+
+
+def _conditional_response(
+    request: Request,
+    body: bytes,
+    etag: str,
+    cache_control: Optional[str] = None
+) -> Response:
+    """Return 304 when the client already holds this body, else the JSON body"""
+    headers = {"ETag": etag}
+    if cache_control:
+        headers["Cache-Control"] = cache_control
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+# Snapshots encoded per streamed chunk of /metrics/{metric_name}
+_STREAM_CHUNK_SIZE = 100
+
+
+async def _stream_snapshots(history: Sequence[MetricSnapshot]) -> AsyncIterator[bytes]:
+    """Encode snapshots as a JSON array, flushing one chunk at a time"""
+    yield b"["
+    for start in range(0, len(history), _STREAM_CHUNK_SIZE):
+        chunk = orjson.dumps([
+            _snapshot_payload(snapshot)
+            for snapshot in history[start:start + _STREAM_CHUNK_SIZE]
+        ])
+        # Strip the chunk's own brackets and join chunks with commas
+        yield (b"," if start else b"") + chunk[1:-1]
+    yield b"]"
+
+
+def _cacheable_response(request: Request, payload: Any, cache_control: str) -> Response:
+    """Serialize a payload and serve it with caching headers"""
+    body = orjson.dumps(payload)
+    return _conditional_response(request, body, _etag_for(body), cache_control)
+
+
+def _report_payload(report: QualityReport, hours: float) -> Dict[str, Any]:
+    """Serialize a quality report for the dashboard, omitting empty trends"""
+    payload = {
+        "report_id": report.report_id,
+        "generated_at": report.generated_at,
+        "time_window_hours": hours,
+        "overall_status": report.overall_status,
+        "health_score": report.health_score,
+        "total_interviews": report.total_interviews,
+        "completed_interviews": report.completed_interviews,
+        "failed_interviews": report.failed_interviews,
+        "avg_completion_rate": report.avg_completion_rate,
+        "avg_engagement_score": report.avg_engagement_score,
+        "avg_response_quality": report.avg_response_quality,
+        "active_alerts_count": len(report.active_alerts),
+        "issues_detected": report.issues_detected,
+        "recommendations": report.recommendations
+    }
+    if report.trends:
+        payload["trends"] = report.trends
+    return payload
+
+
+def _snapshot_payload(snapshot: MetricSnapshot) -> Dict[str, Any]:
+    """Serialize a metric snapshot, omitting a missing interview_id"""
+    payload = {
+        "metric_name": snapshot.metric_name,
+        "value": snapshot.value,
+        "timestamp": snapshot.timestamp,
+        "status": snapshot.status
+    }
+    if snapshot.interview_id is not None:
+        payload["interview_id"] = snapshot.interview_id
+    return payload
+
+
+def _alert_payload(alert: QualityAlert) -> Dict[str, Any]:
+    """Serialize a quality alert, omitting a missing interview_id"""
+    payload = {
+        "alert_id": alert.alert_id,
+        "severity": alert.severity,
+        "metric_name": alert.metric_name,
+        "message": alert.message,
+        "current_value": alert.current_value,
+        "threshold_value": alert.threshold_value,
+        "timestamp": alert.timestamp,
+        "acknowledged": alert.acknowledged,
+        "resolved": alert.resolved
+    }
+    if alert.interview_id is not None:
+        payload["interview_id"] = alert.interview_id
+    return payload
+
+
 # Request/Response Models
 
 class QualityReportResponse(BaseModel):
@@ -50,7 +252,7 @@ class QualityReportResponse(BaseModel):
     active_alerts_count: int
     issues_detected: List[str]
     recommendations: List[str]
-    trends: dict
+    trends: dict = {}
 
 
 class MetricSnapshotResponse(BaseModel):
@@ -99,8 +301,9 @@ class AlertResolveRequest(BaseModel):
 
 # Endpoints
 
-@router.get("/dashboard", response_model=QualityReportResponse)
+@router.get("/dashboard", responses={200: {"model": QualityReportResponse}})
 async def get_quality_dashboard(
+    request: Request,
     hours: int = Query(default=1, ge=1, le=168, description="Time window in hours"),
     monitor: QualityMonitor = Depends(get_quality_monitor)
 ):
@@ -110,32 +313,18 @@ async def get_quality_dashboard(
     Returns comprehensive quality metrics for the specified time window.
     """
     try:
-        time_window = timedelta(hours=hours)
-        report = await monitor.generate_report(time_window)
-
-        return QualityReportResponse(
-            report_id=report.report_id,
-            generated_at=report.generated_at,
-            time_window_hours=hours,
-            overall_status=report.overall_status,
-            health_score=report.health_score,
-            total_interviews=report.total_interviews,
-            completed_interviews=report.completed_interviews,
-            failed_interviews=report.failed_interviews,
-            avg_completion_rate=report.avg_completion_rate,
-            avg_engagement_score=report.avg_engagement_score,
-            avg_response_quality=report.avg_response_quality,
-            active_alerts_count=len(report.active_alerts),
-            issues_detected=report.issues_detected,
-            recommendations=report.recommendations,
-            trends=report.trends
+        report = await _cached_report(monitor, hours, _report_cache)
+
+        return _cacheable_response(
+            request, _report_payload(report, hours), _DASHBOARD_CACHE_CONTROL
         )
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error generating dashboard: {str(e)}")
 
 
-@router.get("/metrics/{metric_name}", response_model=List[MetricSnapshotResponse])
+@router.get("/metrics/{metric_name}", responses={200: {"model": List[MetricSnapshotResponse]}})
 async def get_metric_history(
+    request: Request,
     metric_name: str,
     limit: Optional[int] = Query(default=100, ge=1, le=1000),
     monitor: QualityMonitor = Depends(get_quality_monitor)
@@ -146,64 +335,57 @@ async def get_metric_history(
     Returns time-series data for the requested metric.
     """
     try:
+        # The append count versions the series, so the ETag is known before
+        # any snapshot is encoded
+        series = monitor.metric_series.get(metric_name)
+        version = series.count if series else 0
+        etag = _etag_for(f"{metric_name}:{version}:{limit}".encode())
+        headers = {"ETag": etag, "Cache-Control": _SERIES_CACHE_CONTROL}
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=304, headers=headers)
+
         history = monitor.get_metric_history(metric_name, limit)
 
-        return [
-            MetricSnapshotResponse(
-                metric_name=snapshot.metric_name,
-                value=snapshot.value,
-                timestamp=snapshot.timestamp,
-                status=snapshot.status,
-                interview_id=snapshot.interview_id
-            )
-            for snapshot in history
-        ]
+        return StreamingResponse(
+            _stream_snapshots(history),
+            media_type="application/json",
+            headers=headers
+        )
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error fetching metric history: {str(e)}")
 
 
-@router.get("/metrics", response_model=List[str])
+@router.get("/metrics", responses={200: {"model": List[str]}})
 async def list_available_metrics(
+    request: Request,
     monitor: QualityMonitor = Depends(get_quality_monitor)
 ):
     """
     List all available metrics being tracked
     """
-    return list(monitor.metric_history.keys())
+    return _cacheable_response(
+        request, list(monitor.metric_history.keys()), _CONFIG_CACHE_CONTROL
+    )
 
 
-@router.get("/alerts", response_model=List[AlertResponse])
+@router.get("/alerts", responses={200: {"model": List[AlertResponse]}})
 async def get_alerts(
     severity: Optional[AlertSeverity] = Query(default=None),
     include_resolved: bool = Query(default=False),
+    limit: int = Query(default=100, ge=1, le=1000),
     monitor: QualityMonitor = Depends(get_quality_monitor)
 ):
     """
-    Get active alerts, optionally filtered by severity
+    Get the most recent alerts, optionally filtered by severity
     """
     try:
-        if include_resolved:
-            alerts = list(monitor.alert_history)
-            if severity:
-                alerts = [a for a in alerts if a.severity == severity]
-        else:
-            alerts = monitor.get_active_alerts(severity)
-
-        return [
-            AlertResponse(
-                alert_id=alert.alert_id,
-                severity=alert.severity,
-                metric_name=alert.metric_name,
-                message=alert.message,
-                current_value=alert.current_value,
-                threshold_value=alert.threshold_value,
-                interview_id=alert.interview_id,
-                timestamp=alert.timestamp,
-                acknowledged=alert.acknowledged,
-                resolved=alert.resolved
-            )
-            for alert in alerts
-        ]
+        alerts = heapq.nlargest(
+            limit,
+            monitor.iter_alerts(severity, include_resolved),
+            key=attrgetter("timestamp")
+        )
+
+        return ORJSONResponse([_alert_payload(alert) for alert in alerts])
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error fetching alerts: {str(e)}")
 
@@ -219,6 +401,7 @@ async def acknowledge_alert(
     """
     try:
         monitor.acknowledge_alert(alert_id, request.acknowledged_by)
+        _invalidate_reports()
         return {"status": "acknowledged", "alert_id": alert_id}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error acknowledging alert: {str(e)}")
@@ -235,30 +418,22 @@ async def resolve_alert(
     """
     try:
         monitor.resolve_alert(alert_id, request.resolved_by)
+        _invalidate_reports()
         return {"status": "resolved", "alert_id": alert_id}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error resolving alert: {str(e)}")
 
 
-@router.get("/thresholds", response_model=List[dict])
+@router.get("/thresholds", responses={200: {"model": List[dict]}})
 async def get_thresholds(
+    request: Request,
     monitor: QualityMonitor = Depends(get_quality_monitor)
 ):
     """
     Get current quality thresholds
     """
-    return [
-        {
-            "metric_name": t.metric_name,
-            "warning_threshold": t.warning_threshold,
-            "error_threshold": t.error_threshold,
-            "critical_threshold": t.critical_threshold,
-            "comparison": t.comparison,
-            "window_size": t.window_size,
-            "enabled": t.enabled
-        }
-        for t in monitor.thresholds
-    ]
+    body, etag = _get_thresholds_body(monitor)
+    return _conditional_response(request, body, etag, _CONFIG_CACHE_CONTROL)
 
 
 @router.put("/thresholds/{metric_name}")
@@ -272,15 +447,16 @@ async def update_threshold(
     """
     try:
         # Find and update threshold
-        for threshold in monitor.thresholds:
-            if threshold.metric_name == metric_name:
-                threshold.warning_threshold = request.warning_threshold
-                threshold.error_threshold = request.error_threshold
-                threshold.critical_threshold = request.critical_threshold
-                threshold.comparison = request.comparison
-                threshold.window_size = request.window_size
-                threshold.enabled = request.enabled
-                return {"status": "updated", "metric_name": metric_name}
+        threshold = monitor.thresholds_by_name.get(metric_name)
+        if threshold is not None:
+            threshold.warning_threshold = request.warning_threshold
+            threshold.error_threshold = request.error_threshold
+            threshold.critical_threshold = request.critical_threshold
+            threshold.comparison = request.comparison
+            threshold.window_size = request.window_size
+            threshold.enabled = request.enabled
+            _invalidate_thresholds()
+            return {"status": "updated", "metric_name": metric_name}
 
         # If not found, add new threshold
         new_threshold = QualityThreshold(
@@ -292,12 +468,11 @@ async def update_threshold(
             window_size=request.window_size,
             enabled=request.enabled
         )
-        monitor.thresholds.append(new_threshold)
+        monitor.add_threshold(new_threshold)
+        _invalidate_thresholds()
 
         # Initialize metric history for new threshold
-        if metric_name not in monitor.metric_history:
-            from collections import deque
-            monitor.metric_history[metric_name] = deque(maxlen=new_threshold.window_size)
+        monitor.ensure_metric_history(metric_name, new_threshold.window_size)
 
         return {"status": "created", "metric_name": metric_name}
 
@@ -307,6 +482,7 @@ async def update_threshold(
 
 @router.get("/health")
 async def get_system_health(
+    request: Request,
     monitor: QualityMonitor = Depends(get_quality_monitor)
 ):
     """
@@ -315,87 +491,113 @@ async def get_system_health(
     Quick endpoint for health checks and monitoring systems.
     """
     try:
-        report = await monitor.generate_report(timedelta(minutes=15))
+        report = await _cached_report(monitor, 0.25, _health_report_cache)
 
-        return {
+        return _cacheable_response(request, {
             "status": report.overall_status.value,
             "health_score": report.health_score,
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": report.generated_at,
             "active_critical_alerts": len([
                 a for a in report.active_alerts
                 if a.severity == AlertSeverity.CRITICAL and not a.resolved
             ]),
             "interviews_in_progress": len(monitor.interviews_in_progress),
             "recent_completed": report.completed_interviews
-        }
+        }, _DASHBOARD_CACHE_CONTROL)
     except Exception as e:
-        return {
+        return ORJSONResponse({
             "status": "error",
             "error": str(e),
-            "timestamp": datetime.utcnow().isoformat()
-        }
+            "timestamp": datetime.utcnow()
+        })
+
+
+@router.get("/cache/stats")
+async def get_cache_stats():
+    """
+    Get report cache hit/miss counters
+    """
+    hits = _report_cache_stats["hits"]
+    misses = _report_cache_stats["misses"]
+    total = hits + misses
+
+    return ORJSONResponse({
+        "hits": hits,
+        "misses": misses,
+        "hit_rate": hits / total if total else 0.0,
+        "report_entries": len(_report_cache),
+        "health_report_entries": len(_health_report_cache),
+        "statistics_entries": len(_statistics_cache)
+    })
 
 
 @router.get("/statistics")
 async def get_statistics(
+    request: Request,
     hours: int = Query(default=24, ge=1, le=168),
     monitor: QualityMonitor = Depends(get_quality_monitor)
 ):
     """
     Get detailed statistics for the time window
+
+    Results are cached in-process for 30 seconds and carry an ETag so
+    polling clients can revalidate without re-downloading the body.
     """
+    cached: Optional[Tuple[bytes, str]] = _statistics_cache.get(hours)
+    if cached is None:
+        body = orjson.dumps(_calculate_statistics(monitor, hours))
+        cached = (body, _etag_for(body))
+        _statistics_cache[hours] = cached
+
+    body, etag = cached
+    return _conditional_response(request, body, etag)
+
+
+def _summarize(values: np.ndarray) -> Optional[Dict[str, float]]:
+    """Mean, median, sample stdev, min and max, ignoring NaN (unknown) entries"""
+    known = np.count_nonzero(~np.isnan(values))
+    if known == 0:
+        return None
+
+    return {
+        "mean": float(np.nanmean(values)),
+        "median": float(np.nanmedian(values)),
+        "stdev": float(np.nanstd(values, ddof=1)) if known > 1 else 0,
+        "min": float(np.nanmin(values)),
+        "max": float(np.nanmax(values))
+    }
+
+
+def _calculate_statistics(monitor: QualityMonitor, hours: int) -> Dict[str, Any]:
+    """Calculate detailed statistics for the time window"""
     try:
         time_window = timedelta(hours=hours)
         cutoff_time = datetime.utcnow() - time_window
 
-        # Filter recent completed interviews
-        recent_interviews = [
-            i for i in monitor.completed_interviews
-            if i.completed_at and i.completed_at > cutoff_time
-        ]
+        columns = monitor.get_completed_columns(cutoff_time)
+        n = len(columns["status"])
 
-        if not recent_interviews:
+        if n == 0:
             return {
                 "time_window_hours": hours,
                 "total_interviews": 0,
                 "message": "No interviews in time window"
             }
 
-        # Calculate detailed statistics
-        durations = [i.duration_seconds / 60 for i in recent_interviews]
-        engagement_scores = [i.engagement_metrics.overall_engagement for i in recent_interviews]
-        completion_rates = [i.quality_metrics.completion_percentage for i in recent_interviews]
-
-        import statistics
+        status_counts = np.bincount(columns["status"], minlength=STATUS_FAILED + 1)
+        completed = int(status_counts[STATUS_COMPLETED])
+        failed = int(status_counts[STATUS_FAILED])
 
         return {
             "time_window_hours": hours,
-            "total_interviews": len(recent_interviews),
-            "duration_stats": {
-                "mean": statistics.mean(durations),
-                "median": statistics.median(durations),
-                "stdev": statistics.stdev(durations) if len(durations) > 1 else 0,
-                "min": min(durations),
-                "max": max(durations)
-            },
-            "engagement_stats": {
-                "mean": statistics.mean(engagement_scores),
-                "median": statistics.median(engagement_scores),
-                "stdev": statistics.stdev(engagement_scores) if len(engagement_scores) > 1 else 0,
-                "min": min(engagement_scores),
-                "max": max(engagement_scores)
-            },
-            "completion_stats": {
-                "mean": statistics.mean(completion_rates),
-                "median": statistics.median(completion_rates),
-                "stdev": statistics.stdev(completion_rates) if len(completion_rates) > 1 else 0,
-                "min": min(completion_rates),
-                "max": max(completion_rates)
-            },
+            "total_interviews": n,
+            "duration_stats": _summarize(columns["duration_minutes"]),
+            "engagement_stats": _summarize(columns["engagement"]),
+            "completion_stats": _summarize(columns["completion"]),
             "status_distribution": {
-                "completed": len([i for i in recent_interviews if i.status == "completed"]),
-                "failed": len([i for i in recent_interviews if i.status == "failed"]),
-                "partial": len([i for i in recent_interviews if i.status not in ["completed", "failed"]])
+                "completed": completed,
+                "failed": failed,
+                "partial": n - completed - failed
             }
         }
 
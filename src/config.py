@@ -2,14 +2,21 @@
 Configuration management for the Expert Interviewers system
 """
 
-from pydantic_settings import BaseSettings
+from pydantic_settings import BaseSettings, SettingsConfigDict
 from pydantic import Field
+from functools import lru_cache
 from typing import Optional
 
 
 class Settings(BaseSettings):
     """Application settings loaded from environment variables"""
 
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        case_sensitive=False,
+        frozen=True
+    )
+
     # Application
     app_env: str = Field(default="development", alias="APP_ENV")
     debug: bool = Field(default=False, alias="DEBUG")
@@ -59,16 +66,24 @@ class Settings(BaseSettings):
     default_interview_timeout_minutes: int = Field(default=60, alias="DEFAULT_INTERVIEW_TIMEOUT_MINUTES")
     max_follow_ups_per_question: int = Field(default=3, alias="MAX_FOLLOW_UPS_PER_QUESTION")
     silence_detection_seconds: int = Field(default=5, alias="SILENCE_DETECTION_SECONDS")
+    nlu_max_concurrency: int = Field(default=32, ge=1, alias="NLU_MAX_CONCURRENCY")
+
+    # In-memory API storage (LRU bounded)
+    call_guide_cache_size: int = Field(default=1000, alias="CALL_GUIDE_CACHE_SIZE")
+    interview_cache_size: int = Field(default=10000, alias="INTERVIEW_CACHE_SIZE")
+    insight_cache_size: int = Field(default=1000, alias="INSIGHT_CACHE_SIZE")
 
     # Compliance
     enable_call_recording: bool = Field(default=True, alias="ENABLE_CALL_RECORDING")
     data_retention_days: int = Field(default=90, alias="DATA_RETENTION_DAYS")
     gdpr_compliance: bool = Field(default=True, alias="GDPR_COMPLIANCE")
 
-    class Config:
-        env_file = ".env"
-        case_sensitive = False
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Load settings once per process"""
+    return Settings()
 
 
 # Global settings instance
-settings = Settings()
+settings = get_settings()
@@ -2,16 +2,18 @@
 Intelligence & Adaptation Layer - LLM-powered conversation intelligence
 """
 
-from .llm_provider import LLMProvider, ClaudeProvider, create_llm_provider
+from .llm_provider import LLMProvider, ClaudeProvider, CachedLLMProvider, create_llm_provider
 from .response_analyzer import ResponseAnalyzer
-from .follow_up_generator import FollowUpGenerator
+from .follow_up_generator import FollowUpGenerator, FollowUpBatcher
 from .insight_extractor import InsightExtractor
 
 __all__ = [
     "LLMProvider",
     "ClaudeProvider",
+    "CachedLLMProvider",
     "create_llm_provider",
     "ResponseAnalyzer",
     "FollowUpGenerator",
+    "FollowUpBatcher",
     "InsightExtractor",
 ]
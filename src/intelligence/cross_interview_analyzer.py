@@ -3,12 +3,15 @@ Cross-Interview Analysis with Statistical Pattern Detection
 Enhanced analytics for identifying patterns across multiple interviews
 """
 
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Optional, Tuple, Union, Callable
 from dataclasses import dataclass
+import asyncio
 import logging
-from datetime import datetime
-from collections import defaultdict, Counter
-import statistics
+from datetime import datetime, timezone
+from collections import defaultdict
+import math
+
+import numpy as np
 
 from ..models.analytics import (
     CrossInterviewPattern, SegmentAnalysis, TrendAnalysis,
@@ -19,6 +22,56 @@ from .llm_provider import LLMProvider
 
 logger = logging.getLogger(__name__)
 
+# Sentiment -> numeric score, as a lookup table indexed by sentiment position
+_SENTIMENT_INDEX: Dict[ResponseSentiment, int] = {
+    ResponseSentiment.VERY_POSITIVE: 0,
+    ResponseSentiment.POSITIVE: 1,
+    ResponseSentiment.NEUTRAL: 2,
+    ResponseSentiment.NEGATIVE: 3,
+    ResponseSentiment.VERY_NEGATIVE: 4
+}
+_SENTIMENT_SCORES = np.array([1.0, 0.5, 0.0, -0.5, -1.0])
+_SENTIMENT_SCORE_BY_SENTIMENT: Dict[ResponseSentiment, float] = {
+    sentiment: float(_SENTIMENT_SCORES[index]) for sentiment, index in _SENTIMENT_INDEX.items()
+}
+
+# Above this many values the NumPy reductions beat a Python sum
+_VECTORIZE_THRESHOLD = 64
+
+
+def _fmean(values: List[float]) -> float:
+    """Float mean (0.0 for no values) without statistics.mean's exact arithmetic"""
+    n = len(values)
+    if not n:
+        return 0.0
+    if n > _VECTORIZE_THRESHOLD:
+        return float(np.mean(values))
+    return sum(values) / n
+
+
+def _fstdev(values: List[float]) -> float:
+    """Sample standard deviation (ddof=1, as statistics.stdev); 0.0 below two values"""
+    n = len(values)
+    if n < 2:
+        return 0.0
+    if n > _VECTORIZE_THRESHOLD:
+        return float(np.std(values, ddof=1))
+    mean = sum(values) / n
+    return math.sqrt(sum((x - mean) * (x - mean) for x in values) / (n - 1))
+
+
+def _min_count_for_frequency(min_frequency: float, total: int) -> int:
+    """Smallest count whose share of total is >= min_frequency (exact in floats)"""
+    if total <= 0:
+        return 0
+    count = max(0, math.ceil(min_frequency * total))
+    # min_frequency * total can round either way; settle on the float comparison
+    while count > 0 and (count - 1) / total >= min_frequency:
+        count -= 1
+    while count <= total and count / total < min_frequency:
+        count += 1
+    return count
+
 
 @dataclass
 class StatisticalPattern:
@@ -47,6 +100,89 @@ class SegmentComparison:
     confidence: float
 
 
+@dataclass
+class _SentimentSummary:
+    """Sentiment aggregates of one interview, from a single pass over its responses"""
+    section_means: Dict[str, float]
+    total: float
+    count: int
+
+    @property
+    def mean(self) -> Optional[float]:
+        return self.total / self.count if self.count else None
+
+
+@dataclass
+class _Features:
+    """Per-interview metrics as parallel columns, built once per analysis"""
+    ids: List[str]
+    durations: np.ndarray  # NaN where the duration is unknown
+    engagement: np.ndarray
+    quality: np.ndarray
+    completion: np.ndarray
+    response_counts: np.ndarray
+    avg_sentiment: np.ndarray  # NaN where no response carries a sentiment
+    chronological: np.ndarray  # rows of started interviews, oldest first
+    sentiment: List[_SentimentSummary]  # per row, shared by the detectors
+
+
+def _started_at_column(interviews: List[Interview]) -> np.ndarray:
+    """Start times as datetime64[ns] (naive UTC), NaT where not started"""
+    started = np.empty(len(interviews), dtype="datetime64[ns]")
+    for row, interview in enumerate(interviews):
+        started_at = interview.started_at
+        if started_at is None:
+            started[row] = np.datetime64("NaT")
+        else:
+            if started_at.tzinfo is not None:
+                started_at = started_at.astimezone(timezone.utc).replace(tzinfo=None)
+            started[row] = np.datetime64(started_at, "ns")
+    return started
+
+
+def _chronological_order(started: np.ndarray) -> np.ndarray:
+    """Rows with a start time, sorted by it (stable, so ties keep input order)"""
+    order = np.argsort(started, kind="stable")
+    # NaT sorts last, so the started rows form a prefix
+    return order[:np.count_nonzero(~np.isnat(started))]
+
+
+def _metric_differences(
+    metrics_a: Dict[str, float],
+    metrics_b: Dict[str, float]
+) -> List[Tuple[str, float, float, float, float]]:
+    """(metric, a, b, a - b, percent of b) for metrics present in both, in A's order"""
+    rows = []
+    for key, a in metrics_a.items():
+        b = metrics_b.get(key)
+        if b is None:
+            continue
+        diff = a - b
+        rows.append((key, a, b, diff, (diff / b * 100) if b != 0 else 0))
+    return rows
+
+
+# Theme occurrences above which universal-theme counting switches from a
+# Python dict to NumPy's sort-based unique/bincount kernels
+_COLUMNAR_THEME_THRESHOLD = 50_000
+
+# Trend metric name -> its per-interview column (float, NaN where unknown)
+_TREND_METRICS: Dict[str, Callable[[_Features], np.ndarray]] = {
+    "engagement": lambda f: f.engagement,
+    "completion": lambda f: f.completion,
+    "quality": lambda f: f.quality,
+    "duration": lambda f: f.durations / 60.0,  # Convert to minutes
+    "response_count": lambda f: f.response_counts.astype(np.float64),
+    "sentiment": lambda f: f.avg_sentiment
+}
+
+
+def _nanmean(values: np.ndarray) -> float:
+    """Mean of the known (non-NaN) values, 0.0 if there are none"""
+    known = values[~np.isnan(values)]
+    return float(known.mean()) if known.size else 0.0
+
+
 @dataclass
 class TimeSeriesPoint:
     """Data point in time series"""
@@ -59,14 +195,22 @@ class TimeSeriesPoint:
 class CrossInterviewAnalyzer:
     """Advanced cross-interview analysis with statistical methods"""
 
-    def __init__(self, llm_provider: LLMProvider):
+    def __init__(
+        self,
+        llm_provider: LLMProvider,
+        min_significant_difference_pct: float = 5.0
+    ):
         """
         Initialize cross-interview analyzer
 
         Args:
             llm_provider: LLM provider for qualitative analysis
+            min_significant_difference_pct: Segment comparisons where no metric
+                differs by more than this percentage skip the LLM call
         """
         self.llm = llm_provider
+        self.min_significant_difference_pct = min_significant_difference_pct
+
         logger.info("Initialized CrossInterviewAnalyzer")
 
     async def analyze_patterns(
@@ -87,90 +231,121 @@ class CrossInterviewAnalyzer:
             List of detected patterns
         """
         try:
-            patterns = []
-
-            # Detect universal patterns (appearing in most interviews)
-            universal_patterns = await self._detect_universal_patterns(
-                interviews, min_pattern_frequency
+            return await self._analyze_patterns(
+                interviews, self._build_features(interviews), min_pattern_frequency
             )
-            patterns.extend(universal_patterns)
-
-            # Detect segment-specific patterns
-            segment_patterns = await self._detect_segment_patterns(interviews)
-            patterns.extend(segment_patterns)
-
-            # Detect outliers
-            outlier_patterns = await self._detect_outliers(interviews)
-            patterns.extend(outlier_patterns)
-
-            # Detect temporal patterns
-            temporal_patterns = await self._detect_temporal_patterns(interviews)
-            patterns.extend(temporal_patterns)
-
-            logger.info(f"Detected {len(patterns)} cross-interview patterns")
-            return patterns
 
         except Exception as e:
             logger.error(f"Error analyzing patterns: {e}")
             return []
 
+    async def _analyze_patterns(
+        self,
+        interviews: List[Interview],
+        features: _Features,
+        min_pattern_frequency: float
+    ) -> List[CrossInterviewPattern]:
+        """Run every detector over interviews whose features are already built"""
+        # The detectors are independent, so schedule them together; results
+        # keep the universal, segment, outlier, temporal order
+        detected = await asyncio.gather(
+            self._detect_universal_patterns(interviews, features, min_pattern_frequency),
+            self._detect_segment_patterns(features),
+            self._detect_outliers(features),
+            self._detect_temporal_patterns(features)
+        )
+        patterns = [pattern for group in detected for pattern in group]
+
+        logger.info(f"Detected {len(patterns)} cross-interview patterns")
+        return patterns
+
+    def _build_features(self, interviews: List[Interview]) -> _Features:
+        """Gather each interview's metrics into columns in a single pass"""
+        n = len(interviews)
+        ids = []
+        durations = np.empty(n, dtype=np.float64)
+        engagement = np.empty(n, dtype=np.float64)
+        quality = np.empty(n, dtype=np.float64)
+        completion = np.empty(n, dtype=np.float64)
+        response_counts = np.empty(n, dtype=np.int64)
+        avg_sentiment = np.empty(n, dtype=np.float64)
+        sentiment = []
+
+        for row, interview in enumerate(interviews):
+            ids.append(interview.interview_id)
+            durations[row] = (
+                interview.duration_seconds if interview.duration_seconds is not None else np.nan
+            )
+            engagement[row] = interview.engagement_metrics.overall_engagement
+            quality[row] = interview.quality_metrics.response_quality_average
+            completion[row] = interview.quality_metrics.completion_percentage
+            response_counts[row] = len(interview.responses)
+            summary = self._sentiment_summary(interview)
+            sentiment.append(summary)
+            avg_sentiment[row] = summary.mean if summary.count else np.nan
+
+        return _Features(
+            ids=ids,
+            durations=durations,
+            engagement=engagement,
+            quality=quality,
+            completion=completion,
+            response_counts=response_counts,
+            avg_sentiment=avg_sentiment,
+            chronological=_chronological_order(_started_at_column(interviews)),
+            sentiment=sentiment
+        )
+
     async def _detect_universal_patterns(
         self,
         interviews: List[Interview],
+        features: _Features,
         min_frequency: float
     ) -> List[CrossInterviewPattern]:
         """Detect patterns that appear across most interviews"""
         patterns = []
 
-        # Collect all themes across interviews
-        theme_counter = Counter()
-        theme_interviews = defaultdict(set)
-
-        for interview in interviews:
-            for response in interview.responses:
-                for theme in response.themes:
-                    theme_counter[theme] += 1
-                    theme_interviews[theme].add(interview.interview_id)
-
-        # Identify universal themes
+        # Identify universal themes; most themes fail an integer count check
+        # before any frequency is computed
         total_interviews = len(interviews)
-        for theme, count in theme_counter.items():
-            frequency = len(theme_interviews[theme]) / total_interviews
-            if frequency >= min_frequency:
-                pattern = CrossInterviewPattern(
-                    pattern_type="universal_theme",
-                    description=f"Theme '{theme}' appears in {frequency*100:.1f}% of interviews",
-                    affected_interviews=list(theme_interviews[theme]),
-                    frequency=frequency,
-                    segments={"theme": theme, "occurrence_count": count}
-                )
-                patterns.append(pattern)
+        min_count = _min_count_for_frequency(min_frequency, total_interviews)
+
+        theme_occurrences = sum(len(r.themes) for i in interviews for r in i.responses)
+        if theme_occurrences >= _COLUMNAR_THEME_THRESHOLD:
+            universal_themes = self._aggregate_themes_columnar(features, interviews, min_count)
+        else:
+            universal_themes = self._aggregate_themes(interviews, min_count)
+
+        for theme, interview_ids, count in universal_themes:
+            frequency = len(interview_ids) / total_interviews
+            pattern = CrossInterviewPattern.model_construct(
+                pattern_type="universal_theme",
+                description=f"Theme '{theme}' appears in {frequency*100:.1f}% of interviews",
+                affected_interviews=interview_ids,
+                frequency=frequency,
+                segments={"theme": theme, "occurrence_count": count}
+            )
+            patterns.append(pattern)
 
         # Collect sentiment patterns
         sentiment_by_section = defaultdict(list)
-        for interview in interviews:
-            section_sentiments = defaultdict(list)
-            for response in interview.responses:
-                if response.sentiment:
-                    section_sentiments[response.section_name].append(
-                        self._sentiment_to_score(response.sentiment)
-                    )
-            for section, sentiments in section_sentiments.items():
-                if sentiments:
-                    sentiment_by_section[section].append(statistics.mean(sentiments))
+        for summary in features.sentiment:
+            for section, mean in summary.section_means.items():
+                sentiment_by_section[section].append(mean)
 
         # Identify universal sentiment patterns
         for section, sentiments in sentiment_by_section.items():
             if len(sentiments) >= total_interviews * min_frequency:
-                avg_sentiment = statistics.mean(sentiments)
-                std_sentiment = statistics.stdev(sentiments) if len(sentiments) > 1 else 0
+                avg_sentiment = _fmean(sentiments)
+                std_sentiment = _fstdev(sentiments)
 
                 if abs(avg_sentiment) > 0.3:  # Significant sentiment
                     sentiment_label = "positive" if avg_sentiment > 0 else "negative"
-                    pattern = CrossInterviewPattern(
+                    pattern = CrossInterviewPattern.model_construct(
                         pattern_type="universal_sentiment",
                         description=f"Section '{section}' consistently shows {sentiment_label} sentiment (avg: {avg_sentiment:.2f})",
-                        affected_interviews=[i.interview_id for i in interviews],
+                        # Every sentiment pattern shares the one ids list
+                        affected_interviews=features.ids,
                         frequency=len(sentiments) / total_interviews,
                         segments={
                             "section": section,
@@ -182,47 +357,105 @@ class CrossInterviewAnalyzer:
 
         return patterns
 
+    def _aggregate_themes(
+        self,
+        interviews: List[Interview],
+        min_count: int
+    ) -> List[Tuple[str, List[str], int]]:
+        """(theme, interview ids, occurrences) for themes in at least min_count interviews"""
+        # theme -> [interview ids, occurrences]
+        theme_data: Dict[str, List[Any]] = {}
+
+        for interview in interviews:
+            interview_id = interview.interview_id
+            for response in interview.responses:
+                for theme in response.themes:
+                    entry = theme_data.get(theme)
+                    if entry is None:
+                        theme_data[theme] = [{interview_id}, 1]
+                    else:
+                        entry[0].add(interview_id)
+                        entry[1] += 1
+
+        return [
+            (theme, list(interview_ids), count)
+            for theme, (interview_ids, count) in theme_data.items()
+            if len(interview_ids) >= min_count
+        ]
+
+    def _aggregate_themes_columnar(
+        self,
+        features: _Features,
+        interviews: List[Interview],
+        min_count: int
+    ) -> List[Tuple[str, List[str], int]]:
+        """Columnar _aggregate_themes for large studies, counting with NumPy kernels"""
+        # Flatten every theme occurrence with the row of its interview
+        themes = []
+        rows = []
+        for row, interview in enumerate(interviews):
+            for response in interview.responses:
+                themes.extend(response.themes)
+                rows.extend([row] * len(response.themes))
+
+        names, first_seen, theme_index, occurrences = np.unique(
+            np.array(themes, dtype=str), return_index=True, return_inverse=True, return_counts=True
+        )
+
+        # Distinct (theme, interview) pairs give each theme's interview count
+        pairs = np.unique(theme_index * len(interviews) + np.asarray(rows, dtype=np.int64))
+        pair_themes = pairs // len(interviews)
+        pair_rows = pairs % len(interviews)
+        interview_counts = np.bincount(pair_themes, minlength=names.size)
+
+        # Report in first-appearance order, like the dict path
+        qualifying = np.flatnonzero(interview_counts >= min_count)
+        qualifying = qualifying[np.argsort(first_seen[qualifying], kind="stable")]
+
+        # Pairs are sorted by theme, so each theme's rows are one contiguous slice
+        starts = np.searchsorted(pair_themes, qualifying, side="left")
+        ends = np.searchsorted(pair_themes, qualifying, side="right")
+        return [
+            (
+                str(names[theme]),
+                [features.ids[row] for row in pair_rows[start:end].tolist()],
+                int(occurrences[theme])
+            )
+            for theme, start, end in zip(qualifying.tolist(), starts.tolist(), ends.tolist())
+        ]
+
     async def _detect_segment_patterns(
         self,
-        interviews: List[Interview]
+        features: _Features
     ) -> List[CrossInterviewPattern]:
         """Detect patterns specific to segments"""
         patterns = []
 
         # Group interviews by respondent metadata if available
         # For now, we'll use engagement level as a simple segmentation
-        high_engagement = []
-        low_engagement = []
-
-        for interview in interviews:
-            if interview.engagement_metrics.overall_engagement > 0.7:
-                high_engagement.append(interview)
-            elif interview.engagement_metrics.overall_engagement < 0.4:
-                low_engagement.append(interview)
+        high_engagement = np.flatnonzero(features.engagement > 0.7)
+        low_engagement = np.flatnonzero(features.engagement < 0.4)
 
         # Compare segments
-        if high_engagement and low_engagement:
+        if high_engagement.size and low_engagement.size:
             # Calculate average response quality
-            high_quality = statistics.mean([
-                i.quality_metrics.response_quality_average
-                for i in high_engagement
-            ])
-            low_quality = statistics.mean([
-                i.quality_metrics.response_quality_average
-                for i in low_engagement
-            ])
+            high_quality = float(features.quality[high_engagement].mean())
+            low_quality = float(features.quality[low_engagement].mean())
 
             if abs(high_quality - low_quality) > 0.2:
-                pattern = CrossInterviewPattern(
+                pattern = CrossInterviewPattern.model_construct(
                     pattern_type="segment_difference",
                     description=f"High-engagement respondents show {((high_quality - low_quality) / low_quality * 100):.1f}% better response quality",
-                    affected_interviews=[i.interview_id for i in high_engagement + low_engagement],
+                    affected_interviews=[
+                        features.ids[row]
+                        for row in np.concatenate((high_engagement, low_engagement))
+                    ],
                     frequency=1.0,
                     segments={
                         "high_engagement_quality": high_quality,
                         "low_engagement_quality": low_quality,
-                        "high_engagement_count": len(high_engagement),
-                        "low_engagement_count": len(low_engagement)
+                        "high_engagement_count": int(high_engagement.size),
+                        "low_engagement_count": int(low_engagement.size)
                     }
                 )
                 patterns.append(pattern)
@@ -231,37 +464,42 @@ class CrossInterviewAnalyzer:
 
     async def _detect_outliers(
         self,
-        interviews: List[Interview]
+        features: _Features
     ) -> List[CrossInterviewPattern]:
         """Detect outlier interviews"""
         patterns = []
 
-        if len(interviews) < 3:
+        interview_count = len(features.ids)
+        if interview_count < 3:
             return patterns
 
-        # Calculate statistics for various metrics
-        durations = [i.duration_seconds for i in interviews]
-        response_counts = [len(i.responses) for i in interviews]
-        engagement_scores = [i.engagement_metrics.overall_engagement for i in interviews]
+        # Identify outliers (using simple IQR method); only duration outliers
+        # are reported
+        duration_outliers = self._find_outliers(features.durations, features.ids, "duration")
+        if not duration_outliers:
+            return patterns
 
-        # Identify outliers (using simple IQR method)
-        duration_outliers = self._find_outliers(durations, interviews, "duration")
-        count_outliers = self._find_outliers(response_counts, interviews, "response_count")
-        engagement_outliers = self._find_outliers(engagement_scores, interviews, "engagement")
+        # Every outlier shares the metric's average. Deviation relative to a
+        # zero or negative average is meaningless, so report none then
+        avg_value = duration_outliers[0][3]
+        if avg_value <= 0:
+            return patterns
+        threshold = 0.5 * avg_value  # 50% deviation
 
         # Create patterns for significant outliers
-        for outlier_interview, metric_name, value, avg_value in duration_outliers:
-            if abs(value - avg_value) / avg_value > 0.5:  # 50% deviation
-                pattern = CrossInterviewPattern(
+        for interview_id, metric_name, value, _ in duration_outliers:
+            deviation = abs(value - avg_value)
+            if deviation > threshold:
+                pattern = CrossInterviewPattern.model_construct(
                     pattern_type="outlier",
                     description=f"Interview has unusual {metric_name}: {value:.1f} vs average {avg_value:.1f}",
-                    affected_interviews=[outlier_interview.interview_id],
-                    frequency=1.0 / len(interviews),
+                    affected_interviews=[interview_id],
+                    frequency=1.0 / interview_count,
                     segments={
                         "metric": metric_name,
                         "value": value,
                         "average": avg_value,
-                        "deviation_percent": abs(value - avg_value) / avg_value * 100
+                        "deviation_percent": deviation / avg_value * 100
                     }
                 )
                 patterns.append(pattern)
@@ -270,100 +508,104 @@ class CrossInterviewAnalyzer:
 
     def _find_outliers(
         self,
-        values: List[float],
-        interviews: List[Interview],
+        values: np.ndarray,
+        interview_ids: List[str],
         metric_name: str
-    ) -> List[Tuple[Interview, str, float, float]]:
-        """Find outliers using IQR method"""
-        if len(values) < 3:
+    ) -> List[Tuple[str, str, float, float]]:
+        """Find outliers using IQR method, ignoring unknown (NaN) values"""
+        rows = np.flatnonzero(~np.isnan(values))
+        if rows.size < 3:
             return []
 
-        sorted_values = sorted(values)
-        q1 = sorted_values[len(sorted_values) // 4]
-        q3 = sorted_values[3 * len(sorted_values) // 4]
-        iqr = q3 - q1
-        lower_bound = q1 - 1.5 * iqr
-        upper_bound = q3 + 1.5 * iqr
-        avg_value = statistics.mean(values)
+        known = values[rows]
 
-        outliers = []
-        for interview, value in zip(interviews, values):
-            if value < lower_bound or value > upper_bound:
-                outliers.append((interview, metric_name, value, avg_value))
+        # Interpolated quartiles (selection-based, no full sort)
+        q1, q3 = np.quantile(known, (0.25, 0.75))
+        iqr = q3 - q1
+        avg_value = float(known.mean())
 
-        return outliers
+        outlier_mask = (known < q1 - 1.5 * iqr) | (known > q3 + 1.5 * iqr)
+        return [
+            (interview_ids[row], metric_name, float(values[row]), avg_value)
+            for row in rows[outlier_mask]
+        ]
 
     async def _detect_temporal_patterns(
         self,
-        interviews: List[Interview]
+        features: _Features
     ) -> List[CrossInterviewPattern]:
         """Detect patterns over time"""
         patterns = []
 
-        # Sort interviews by date
-        sorted_interviews = sorted(
-            [i for i in interviews if i.started_at],
-            key=lambda x: x.started_at
-        )
+        # Rows of dated interviews, in date order
+        rows = features.chronological
 
-        if len(sorted_interviews) < 3:
+        if rows.size < 3:
             return patterns
 
-        # Calculate sentiment trend over time
-        sentiment_over_time = []
-        for interview in sorted_interviews:
-            avg_sentiment = statistics.mean([
-                self._sentiment_to_score(r.sentiment)
-                for r in interview.responses
-                if r.sentiment
-            ]) if interview.responses else 0.0
-
-            sentiment_over_time.append(avg_sentiment)
+        # Sentiment trend over time; interviews without sentiment count as neutral
+        sentiment_over_time = np.nan_to_num(features.avg_sentiment[rows], nan=0.0)
 
         # Check for trends (simple linear trend)
-        if len(sentiment_over_time) >= 3:
-            trend = self._calculate_trend(sentiment_over_time)
-            if abs(trend) > 0.1:  # Significant trend
-                direction = "increasing" if trend > 0 else "decreasing"
-                pattern = CrossInterviewPattern(
-                    pattern_type="temporal_trend",
-                    description=f"Sentiment is {direction} over time (trend: {trend:.3f})",
-                    affected_interviews=[i.interview_id for i in sorted_interviews],
-                    frequency=1.0,
-                    segments={
-                        "metric": "sentiment",
-                        "trend_direction": direction,
-                        "trend_slope": trend,
-                        "start_value": sentiment_over_time[0],
-                        "end_value": sentiment_over_time[-1]
-                    }
-                )
-                patterns.append(pattern)
+        trend = self._calculate_trend(sentiment_over_time)
+        if abs(trend) > 0.1:  # Significant trend
+            direction = "increasing" if trend > 0 else "decreasing"
+            pattern = CrossInterviewPattern.model_construct(
+                pattern_type="temporal_trend",
+                description=f"Sentiment is {direction} over time (trend: {trend:.3f})",
+                affected_interviews=[features.ids[row] for row in rows],
+                frequency=1.0,
+                segments={
+                    "metric": "sentiment",
+                    "trend_direction": direction,
+                    "trend_slope": trend,
+                    "start_value": float(sentiment_over_time[0]),
+                    "end_value": float(sentiment_over_time[-1])
+                }
+            )
+            patterns.append(pattern)
 
         return patterns
 
-    def _calculate_trend(self, values: List[float]) -> float:
+    def _calculate_trend(self, values: Union[List[float], np.ndarray]) -> float:
         """Calculate simple linear trend"""
-        n = len(values)
-        x = list(range(n))
-        x_mean = statistics.mean(x)
-        y_mean = statistics.mean(values)
+        y = np.asarray(values, dtype=np.float64)
+        x = np.arange(y.size, dtype=np.float64) - (y.size - 1) / 2.0  # centered
 
-        numerator = sum((x[i] - x_mean) * (values[i] - y_mean) for i in range(n))
-        denominator = sum((x[i] - x_mean) ** 2 for i in range(n))
-
-        return numerator / denominator if denominator != 0 else 0.0
+        denominator = float(x @ x)
+        if denominator == 0:
+            return 0.0
+        # x is centered, so subtracting the mean of y would not change x @ y
+        return float(x @ y) / denominator
 
     def _sentiment_to_score(self, sentiment: ResponseSentiment) -> float:
         """Convert sentiment enum to numeric score"""
-        sentiment_map = {
-            ResponseSentiment.VERY_POSITIVE: 1.0,
-            ResponseSentiment.POSITIVE: 0.5,
-            ResponseSentiment.NEUTRAL: 0.0,
-            ResponseSentiment.NEGATIVE: -0.5,
-            ResponseSentiment.VERY_NEGATIVE: -1.0
-        }
-        return sentiment_map.get(sentiment, 0.0)
+        return _SENTIMENT_SCORE_BY_SENTIMENT.get(sentiment, 0.0)
+
+    def _sentiment_summary(self, interview: Interview) -> _SentimentSummary:
+        """Per-section and overall sentiment of an interview in one pass"""
+        # Running sums instead of per-section lists
+        section_sums: Dict[str, List[float]] = {}
+        total = 0.0
+        count = 0
+        for response in interview.responses:
+            if not response.sentiment:
+                continue
+            score = _SENTIMENT_SCORE_BY_SENTIMENT.get(response.sentiment, 0.0)
+            total += score
+            count += 1
+            acc = section_sums.get(response.section_name)
+            if acc is None:
+                section_sums[response.section_name] = [score, 1]
+            else:
+                acc[0] += score
+                acc[1] += 1
+
+        return _SentimentSummary(
+            section_means={section: acc[0] / acc[1] for section, acc in section_sums.items()},
+            total=total,
+            count=count
+        )
 
     async def compare_segments(
         self,
@@ -389,18 +631,46 @@ class CrossInterviewAnalyzer:
             metrics_a = self._calculate_segment_metrics(segment_a_interviews)
             metrics_b = self._calculate_segment_metrics(segment_b_interviews)
 
-            # Calculate differences
-            differences = {}
-            for metric_name in metrics_a.keys():
-                if metric_name in metrics_b:
-                    diff = metrics_a[metric_name] - metrics_b[metric_name]
-                    pct_diff = (diff / metrics_b[metric_name] * 100) if metrics_b[metric_name] != 0 else 0
-                    differences[metric_name] = {
-                        "absolute": diff,
-                        "percentage": pct_diff,
-                        "segment_a_value": metrics_a[metric_name],
-                        "segment_b_value": metrics_b[metric_name]
-                    }
+            # Calculate differences once for both the result and the prompt
+            metric_rows = _metric_differences(metrics_a, metrics_b)
+            differences = {
+                metric_name: {
+                    "absolute": diff,
+                    "percentage": pct_diff,
+                    "segment_a_value": value_a,
+                    "segment_b_value": value_b
+                }
+                for metric_name, value_a, value_b, diff, pct_diff in metric_rows
+            }
+
+            analysis = SegmentAnalysis(
+                segment_name=f"{segment_a_name} vs {segment_b_name}",
+                segment_criteria={"comparison": "segment_comparison"},
+                interview_count=len(segment_a_interviews) + len(segment_b_interviews),
+                interview_ids=[
+                    i.interview_id
+                    for segment in (segment_a_interviews, segment_b_interviews)
+                    for i in segment
+                ],
+                key_insights=[],
+                unique_themes=[],
+                avg_sentiment=metrics_a.get("avg_sentiment", 0.0),
+                differences_from_average=differences,
+                statistical_significance={}
+            )
+
+            # Nothing material to explain: skip the LLM round-trip. A zero
+            # baseline reports 0% so any change from it counts as material.
+            if not any(
+                abs(pct_diff) > self.min_significant_difference_pct
+                or (value_b == 0 and diff != 0)
+                for _, _, value_b, diff, pct_diff in metric_rows
+            ):
+                logger.info(
+                    f"No significant differences between {segment_a_name} and "
+                    f"{segment_b_name}; skipped LLM insights"
+                )
+                return analysis
 
             # Use LLM to generate insights about differences
             comparison_prompt = f"""Compare these two interview segments:
@@ -409,7 +679,7 @@ Segment A: {segment_a_name} ({len(segment_a_interviews)} interviews)
 Segment B: {segment_b_name} ({len(segment_b_interviews)} interviews)
 
 Metrics:
-{self._format_metrics_for_comparison(metrics_a, metrics_b)}
+{self._format_metrics_for_comparison(metric_rows)}
 
 Provide insights about:
 1. Key differences between segments
@@ -423,19 +693,6 @@ Provide insights about:
                 temperature=0.5
             )
 
-            # Create segment analysis
-            analysis = SegmentAnalysis(
-                segment_name=f"{segment_a_name} vs {segment_b_name}",
-                segment_criteria={"comparison": "segment_comparison"},
-                interview_count=len(segment_a_interviews) + len(segment_b_interviews),
-                interview_ids=[i.interview_id for i in segment_a_interviews + segment_b_interviews],
-                key_insights=[],
-                unique_themes=[],
-                avg_sentiment=metrics_a.get("avg_sentiment", 0.0),
-                differences_from_average=differences,
-                statistical_significance={}
-            )
-
             logger.info(f"Completed segment comparison: {segment_a_name} vs {segment_b_name}")
             return analysis
 
@@ -456,61 +713,37 @@ Provide insights about:
         if not interviews:
             return {}
 
-        metrics = {}
-
-        # Average duration
-        metrics["avg_duration"] = statistics.mean([i.duration_seconds for i in interviews])
-
-        # Average engagement
-        metrics["avg_engagement"] = statistics.mean([
-            i.engagement_metrics.overall_engagement for i in interviews
-        ])
-
-        # Average completion rate
-        metrics["avg_completion"] = statistics.mean([
-            i.quality_metrics.completion_percentage for i in interviews
-        ])
-
-        # Average response quality
-        metrics["avg_response_quality"] = statistics.mean([
-            i.quality_metrics.response_quality_average for i in interviews
-        ])
-
-        # Average sentiment
-        all_sentiments = []
-        for interview in interviews:
-            for response in interview.responses:
-                if response.sentiment:
-                    all_sentiments.append(self._sentiment_to_score(response.sentiment))
+        features = self._build_features(interviews)
 
-        metrics["avg_sentiment"] = statistics.mean(all_sentiments) if all_sentiments else 0.0
-
-        # Average response length
-        all_response_lengths = []
-        for interview in interviews:
-            for response in interview.responses:
-                all_response_lengths.append(len(response.response_text.split()))
+        summaries = features.sentiment
+        sentiment_count = sum(summary.count for summary in summaries)
 
-        metrics["avg_response_length"] = statistics.mean(all_response_lengths) if all_response_lengths else 0
+        responses = [r for i in interviews for r in i.responses]
+        response_lengths = np.fromiter(
+            (r.word_count for r in responses), dtype=np.float64, count=len(responses)
+        )
 
-        return metrics
+        return {
+            "avg_duration": _nanmean(features.durations),
+            "avg_engagement": float(features.engagement.mean()),
+            "avg_completion": float(features.completion.mean()),
+            "avg_response_quality": float(features.quality.mean()),
+            "avg_sentiment": (
+                sum(summary.total for summary in summaries) / sentiment_count
+                if sentiment_count else 0.0
+            ),
+            "avg_response_length": float(response_lengths.mean()) if response_lengths.size else 0.0,
+        }
 
     def _format_metrics_for_comparison(
         self,
-        metrics_a: Dict[str, float],
-        metrics_b: Dict[str, float]
+        metric_rows: List[Tuple[str, float, float, float, float]]
     ) -> str:
-        """Format metrics for LLM prompt"""
-        lines = []
-        for key in metrics_a.keys():
-            if key in metrics_b:
-                diff = metrics_a[key] - metrics_b[key]
-                pct = (diff / metrics_b[key] * 100) if metrics_b[key] != 0 else 0
-                lines.append(
-                    f"- {key}: A={metrics_a[key]:.2f}, B={metrics_b[key]:.2f}, "
-                    f"Diff={diff:.2f} ({pct:+.1f}%)"
-                )
-        return "\n".join(lines)
+        """Format metric differences for LLM prompt"""
+        return "\n".join(
+            f"- {key}: A={a:.2f}, B={b:.2f}, Diff={diff:.2f} ({pct:+.1f}%)"
+            for key, a, b, diff, pct in metric_rows
+        )
 
     async def analyze_trends(
         self,
@@ -530,13 +763,12 @@ Provide insights about:
             TrendAnalysis with trend information
         """
         try:
-            # Sort interviews by date
-            sorted_interviews = sorted(
-                [i for i in interviews if i.started_at],
-                key=lambda x: x.started_at
-            )
+            features = self._build_features(interviews)
 
-            if len(sorted_interviews) < 2:
+            # Rows of dated interviews, in date order
+            rows = features.chronological
+
+            if rows.size < 2:
                 logger.warning("Not enough interviews for trend analysis")
                 return TrendAnalysis(
                     metric_name=metric_name,
@@ -544,16 +776,26 @@ Provide insights about:
                     confidence=0.0
                 )
 
-            # Extract time series data
-            time_series = []
-            for interview in sorted_interviews:
-                value = self._extract_metric_value(interview, metric_name)
-                if value is not None:
-                    time_series.append({
-                        "timestamp": interview.started_at.isoformat(),
-                        "value": value,
-                        "interview_id": interview.interview_id
-                    })
+            # Extract time series data from the metric's column, skipping
+            # interviews where it is unknown (NaN)
+            column = _TREND_METRICS.get(metric_name)
+            if column is None:
+                rows = rows[:0]
+                values = np.empty(0)
+            else:
+                values = column(features)[rows]
+                known = ~np.isnan(values)
+                rows = rows[known]
+                values = values[known]
+
+            time_series = [
+                {
+                    "timestamp": interviews[row].started_at.isoformat(),
+                    "value": value,
+                    "interview_id": features.ids[row]
+                }
+                for row, value in zip(rows.tolist(), values.tolist())
+            ]
 
             if len(time_series) < 2:
                 return TrendAnalysis(
@@ -564,7 +806,6 @@ Provide insights about:
                 )
 
             # Calculate trend
-            values = [point["value"] for point in time_series]
             trend_slope = self._calculate_trend(values)
 
             # Determine direction
@@ -578,7 +819,8 @@ Provide insights about:
             # Calculate confidence based on consistency
             confidence = min(1.0, abs(trend_slope) * 10)
 
-            return TrendAnalysis(
+            # Fields are computed and in range here, so skip re-validation
+            return TrendAnalysis.model_construct(
                 metric_name=metric_name,
                 time_series=time_series,
                 direction=direction,
@@ -594,30 +836,6 @@ Provide insights about:
                 confidence=0.0
             )
 
-    def _extract_metric_value(self, interview: Interview, metric_name: str) -> Optional[float]:
-        """Extract a specific metric value from an interview"""
-        metric_map = {
-            "engagement": interview.engagement_metrics.overall_engagement,
-            "completion": interview.quality_metrics.completion_percentage,
-            "quality": interview.quality_metrics.response_quality_average,
-            "duration": interview.duration_seconds / 60.0,  # Convert to minutes
-            "response_count": len(interview.responses)
-        }
-
-        if metric_name in metric_map:
-            return float(metric_map[metric_name])
-
-        # Handle sentiment specially
-        if metric_name == "sentiment":
-            sentiments = [
-                self._sentiment_to_score(r.sentiment)
-                for r in interview.responses
-                if r.sentiment
-            ]
-            return statistics.mean(sentiments) if sentiments else None
-
-        return None
-
     async def generate_executive_summary(
         self,
         interviews: List[Interview],
@@ -634,14 +852,20 @@ Provide insights about:
             Executive summary text
         """
         try:
-            # Calculate aggregate statistics
+            # Calculate aggregate statistics from the same columns the
+            # detectors use
+            features = self._build_features(interviews)
             total_interviews = len(interviews)
-            total_responses = sum(len(i.responses) for i in interviews)
-            avg_duration = statistics.mean([i.duration_seconds for i in interviews]) / 60
-            avg_engagement = statistics.mean([i.engagement_metrics.overall_engagement for i in interviews])
+            total_responses = int(features.response_counts.sum())
+            avg_duration = _nanmean(features.durations) / 60
+            avg_engagement = float(features.engagement.mean()) if total_interviews else 0.0
 
             # Detect patterns
-            patterns = await self.analyze_patterns(interviews, research_objective)
+            try:
+                patterns = await self._analyze_patterns(interviews, features, 0.3)
+            except Exception as e:
+                logger.error(f"Error analyzing patterns: {e}")
+                patterns = []
 
             # Build prompt
             prompt = f"""Generate an executive summary for this research:
@@ -686,8 +910,7 @@ Write in a professional, business-focused tone.
         if not patterns:
             return "No significant patterns detected."
 
-        lines = []
-        for i, pattern in enumerate(patterns[:10], 1):  # Limit to top 10
-            lines.append(f"{i}. [{pattern.pattern_type}] {pattern.description}")
-
-        return "\n".join(lines)
+        return "\n".join(
+            f"{i}. [{pattern.pattern_type}] {pattern.description}"
+            for i, pattern in enumerate(patterns[:10], 1)  # Limit to top 10
+        )
@@ -2,9 +2,17 @@
 Follow-up Generator - Dynamically generates contextual follow-up questions
 """
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Callable, Mapping, Optional, Set, Tuple
+from functools import lru_cache
+from operator import attrgetter
+from types import MappingProxyType
 from dataclasses import dataclass
+import asyncio
+import hashlib
+import heapq
 import logging
+import orjson
+from cachetools import LRUCache
 from ..models.call_guide import Question, FollowUpAction
 from ..models.interview import InterviewResponse
 from .llm_provider import LLMProvider
@@ -17,54 +25,311 @@ logger = logging.getLogger(__name__)
 class FollowUpQuestion:
     """A generated follow-up question"""
     question_text: str
-    reason: str  # Why this follow-up is valuable
     action_type: FollowUpAction
     priority: float  # 0.0 to 1.0
-    expected_insight: str  # What insight we hope to gain
+    reason: str = ""  # Why this follow-up is valuable
+    expected_insight: str = ""  # What insight we hope to gain
+
+
+# Follow-up templates for different triggers, shared by all generators
+_TEMPLATES: Mapping[FollowUpAction, Tuple[str, ...]] = MappingProxyType({
+    FollowUpAction.DRILL_DEEPER: (
+        "Can you tell me more about {topic}?",
+        "What specifically about {topic} stands out to you?",
+        "Help me understand {topic} in more detail.",
+    ),
+    FollowUpAction.PROBE: (
+        "That's interesting. Can you elaborate on that?",
+        "What led you to that conclusion?",
+        "Can you walk me through your thinking on that?",
+    ),
+    FollowUpAction.CLARIFY: (
+        "Just to make sure I understand, you're saying {clarification}?",
+        "Can you clarify what you mean by {term}?",
+        "I want to make sure I understand - could you explain that differently?",
+    ),
+    FollowUpAction.EXAMPLE: (
+        "Can you give me a specific example of that?",
+        "When was the last time you experienced that?",
+        "Can you describe a situation where that happened?",
+    ),
+    FollowUpAction.COMPARE: (
+        "How does that compare to {comparison}?",
+        "What's different about {aspect} compared to before?",
+        "How would you contrast that with {alternative}?",
+    ),
+})
+
+
+_BY_PRIORITY = attrgetter("priority")
+
+_ACTION_BY_NAME: Dict[str, FollowUpAction] = {action.value: action for action in FollowUpAction}
+
+
+def _parse_action(name: str) -> FollowUpAction:
+    """Map an LLM-provided action name to its FollowUpAction"""
+    try:
+        return _ACTION_BY_NAME[name]
+    except KeyError:
+        raise ValueError(f"Unknown follow-up action from LLM: {name!r}") from None
+
+
+# Response signals that always warrant follow-ups
+_INTEREST_SIGNALS = frozenset({"enthusiasm", "emotional"})
+
+# Cached follow-ups are shared across time remaining within one bucket
+_TIME_REMAINING_BUCKET_SECONDS = 60
+
+# Static tail of every generation prompt
+_TASK_SUFFIX = """
+**Task:**
+Generate follow-up questions that will extract maximum insight value. Consider:
+
+1. **DRILL_DEEPER**: Ask for more details on interesting points
+2. **PROBE**: Explore reasoning and motivations
+3. **CLARIFY**: Resolve vague or ambiguous statements
+4. **EXAMPLE**: Request concrete examples
+5. **COMPARE**: Compare with alternatives or past experiences
+
+For each follow-up:
+- Make it conversational and natural
+- Focus on uncovering deeper insights
+- Avoid yes/no questions
+- Prioritize questions that align with research objectives
+- Consider the time remaining
+
+Generate up to 3 follow-up questions, ranked by priority (most valuable first).
+"""
+
+
+# Output schemas by (max_follow_ups, include_rationale), built once and
+# shared (do not mutate)
+_SCHEMA_BY_MAX: Dict[Tuple[int, bool], Dict[str, Any]] = {}
+
+
+def _follow_up_schema(max_follow_ups: int, include_rationale: bool = False) -> Dict[str, Any]:
+    """Get the follow-up output schema for a maximum item count"""
+    key = (max_follow_ups, include_rationale)
+    schema = _SCHEMA_BY_MAX.get(key)
+    if schema is None:
+        item_properties = {
+            "question_text": {"type": "string"},
+            "action_type": {
+                "type": "string",
+                "enum": ["drill_deeper", "probe", "clarify", "example", "compare"]
+            },
+            "priority": {"type": "number", "minimum": 0, "maximum": 1},
+        }
+        required = ["question_text", "action_type", "priority"]
+        # The rationale strings are most of each follow-up's output tokens
+        if include_rationale:
+            item_properties["reason"] = {"type": "string"}
+            item_properties["expected_insight"] = {"type": "string"}
+            required.append("reason")
+
+        schema = _SCHEMA_BY_MAX[key] = {
+            "type": "object",
+            "properties": {
+                "follow_ups": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": item_properties,
+                        "required": required
+                    },
+                    "maxItems": max_follow_ups
+                }
+            },
+            "required": ["follow_ups"]
+        }
+    return schema
+
+
+# (lowercased response, word count, analysis) -> whether a trigger fires
+_TriggerPredicate = Callable[[str, int, ResponseAnalysis], bool]
+
+
+@lru_cache(maxsize=1024)
+def _compile_condition(condition: str) -> _TriggerPredicate:
+    """
+    Turn a trigger condition into a predicate, once per distinct condition
+
+    Args:
+        condition: Condition string (e.g., "vague_response", "enthusiasm")
+
+    Returns:
+        Predicate that is True when the condition is met
+    """
+    condition_lower = condition.lower()
+
+    # Check for common trigger conditions
+    if "vague" in condition_lower:
+        return lambda response, words, analysis: analysis.information_density < 0.4
+
+    if "enthusiasm" in condition_lower:
+        return lambda response, words, analysis: "enthusiasm" in analysis.signals
+
+    if "hesitation" in condition_lower:
+        return lambda response, words, analysis: "hesitation" in analysis.signals
+
+    if "short" in condition_lower:
+        return lambda response, words, analysis: words < 20
+
+    if "detailed" in condition_lower or "long" in condition_lower:
+        return lambda response, words, analysis: words > 100
+
+    if "negative" in condition_lower:
+        return lambda response, words, analysis: "negative" in analysis.sentiment.value
+
+    # Default: check if condition keywords appear in response
+    return lambda response, words, analysis: condition_lower in response
+
+
+# (prompt, schema, system prompt, caller's future)
+_BatchItem = Tuple[str, Dict[str, Any], Optional[str], asyncio.Future]
+
+
+class FollowUpBatcher:
+    """
+    Coalesces concurrent structured LLM calls into provider batches
+
+    Calls arriving within max_wait_ms of the first pending one, or until
+    max_batch are queued, are flushed together through
+    LLMProvider.generate_structured_batch. Each caller awaits its own future,
+    which receives that prompt's result or exception.
+    """
+
+    def __init__(
+        self,
+        llm_provider: LLMProvider,
+        max_batch: int = 16,
+        max_wait_ms: float = 20.0
+    ):
+        """
+        Initialize batcher
+
+        Args:
+            llm_provider: LLM provider to send batches to
+            max_batch: Pending calls that trigger an immediate flush
+            max_wait_ms: Longest a call waits for others to join its batch
+        """
+        self.llm = llm_provider
+        self.max_batch = max_batch
+        self.max_wait = max_wait_ms / 1000
+        self._pending: List[_BatchItem] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._tasks: Set[asyncio.Task] = set()
+
+    async def submit(
+        self,
+        prompt: str,
+        output_schema: Dict[str, Any],
+        system_prompt: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Queue a structured generation and wait for its batch to complete
+
+        Args:
+            prompt: User prompt
+            output_schema: JSON schema for output
+            system_prompt: System prompt
+
+        Returns:
+            Parsed structured output
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((prompt, output_schema, system_prompt, future))
+
+        if len(self._pending) >= self.max_batch:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_wait, self._flush)
+
+        return await future
+
+    def _flush(self):
+        """Send every pending call, one provider batch per schema/system prompt"""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        batch, self._pending = self._pending, []
+
+        groups: List[Tuple[Dict[str, Any], Optional[str], List[_BatchItem]]] = []
+        for item in batch:
+            for schema, system_prompt, items in groups:
+                if (schema is item[1] or schema == item[1]) and system_prompt == item[2]:
+                    items.append(item)
+                    break
+            else:
+                groups.append((item[1], item[2], [item]))
+
+        for schema, system_prompt, items in groups:
+            task = asyncio.ensure_future(self._run_batch(items, schema, system_prompt))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run_batch(
+        self,
+        items: List[_BatchItem],
+        output_schema: Dict[str, Any],
+        system_prompt: Optional[str]
+    ):
+        """Generate one batch and resolve each caller's future"""
+        try:
+            results = await self.llm.generate_structured_batch(
+                prompts=[prompt for prompt, _, _, _ in items],
+                output_schema=output_schema,
+                system_prompt=system_prompt
+            )
+        except Exception as e:
+            results = [e] * len(items)
+
+        # A short result list would otherwise leave some callers waiting forever
+        if len(results) != len(items):
+            error = RuntimeError(
+                f"generate_structured_batch returned {len(results)} results "
+                f"for {len(items)} prompts"
+            )
+            results = [error] * len(items)
+
+        for (_, _, _, future), result in zip(items, results):
+            # The caller may have been cancelled while the batch ran
+            if future.done():
+                continue
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
 
 
 class FollowUpGenerator:
     """Generates adaptive follow-up questions based on responses"""
 
-    def __init__(self, llm_provider: LLMProvider):
+    templates = _TEMPLATES
+
+    def __init__(
+        self,
+        llm_provider: LLMProvider,
+        batcher: Optional[FollowUpBatcher] = None,
+        cache_size: int = 4096
+    ):
         """
         Initialize follow-up generator
 
         Args:
             llm_provider: LLM provider for generation
+            batcher: Batcher shared by concurrent calls; without one each
+                generation is sent on its own with no batching delay
+            cache_size: Generated follow-up lists kept for repeated inputs
         """
         self.llm = llm_provider
+        self.batcher = batcher
+        self._cache: LRUCache = LRUCache(maxsize=cache_size)
+        self._inflight: Dict[bytes, asyncio.Future] = {}
         logger.info("Initialized FollowUpGenerator")
 
-        # Follow-up templates for different triggers
-        self.templates = {
-            FollowUpAction.DRILL_DEEPER: [
-                "Can you tell me more about {topic}?",
-                "What specifically about {topic} stands out to you?",
-                "Help me understand {topic} in more detail.",
-            ],
-            FollowUpAction.PROBE: [
-                "That's interesting. Can you elaborate on that?",
-                "What led you to that conclusion?",
-                "Can you walk me through your thinking on that?",
-            ],
-            FollowUpAction.CLARIFY: [
-                "Just to make sure I understand, you're saying {clarification}?",
-                "Can you clarify what you mean by {term}?",
-                "I want to make sure I understand - could you explain that differently?",
-            ],
-            FollowUpAction.EXAMPLE: [
-                "Can you give me a specific example of that?",
-                "When was the last time you experienced that?",
-                "Can you describe a situation where that happened?",
-            ],
-            FollowUpAction.COMPARE: [
-                "How does that compare to {comparison}?",
-                "What's different about {aspect} compared to before?",
-                "How would you contrast that with {alternative}?",
-            ],
-        }
-
     async def generate_follow_ups(
         self,
         original_question: Question,
@@ -72,6 +337,7 @@ class FollowUpGenerator:
         analysis: ResponseAnalysis,
         context: Optional[Dict[str, Any]] = None,
         max_follow_ups: int = 3,
+        include_rationale: bool = False,
     ) -> List[FollowUpQuestion]:
         """
         Generate contextual follow-up questions
@@ -82,6 +348,7 @@ class FollowUpGenerator:
             analysis: Analysis of the response
             context: Optional context (interview history, objectives, etc.)
             max_follow_ups: Maximum number of follow-ups to generate
+            include_rationale: Also have the LLM fill reason and expected_insight
 
         Returns:
             List of generated follow-up questions, ranked by priority
@@ -92,65 +359,160 @@ class FollowUpGenerator:
                 logger.debug("No follow-ups needed for this response")
                 return []
 
-            # Build generation prompt
-            prompt = self._build_generation_prompt(
-                original_question, response, analysis, context
+            # Repeated (question, answer, analysis) inputs reuse earlier output
+            cache_key = self._cache_key(
+                original_question, response, analysis, context, max_follow_ups,
+                include_rationale
             )
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                logger.debug("Reusing cached follow-up questions")
+                return list(cached)
+
+            # Identical calls already in flight share that generation
+            generation = self._inflight.get(cache_key)
+            if generation is None:
+                generation = asyncio.ensure_future(self._generate(
+                    original_question, response, analysis, context, max_follow_ups,
+                    include_rationale, cache_key
+                ))
+                self._inflight[cache_key] = generation
+                generation.add_done_callback(lambda _: self._inflight.pop(cache_key, None))
+            else:
+                logger.debug("Joining in-flight follow-up generation")
+
+            # Shielded so one caller's cancellation doesn't fail the others
+            return list(await asyncio.shield(generation))
 
-            # Define output schema
-            schema = {
-                "type": "object",
-                "properties": {
-                    "follow_ups": {
-                        "type": "array",
-                        "items": {
-                            "type": "object",
-                            "properties": {
-                                "question_text": {"type": "string"},
-                                "reason": {"type": "string"},
-                                "action_type": {
-                                    "type": "string",
-                                    "enum": ["drill_deeper", "probe", "clarify", "example", "compare"]
-                                },
-                                "priority": {"type": "number", "minimum": 0, "maximum": 1},
-                                "expected_insight": {"type": "string"}
-                            },
-                            "required": ["question_text", "reason", "action_type", "priority"]
-                        },
-                        "maxItems": max_follow_ups
-                    }
-                },
-                "required": ["follow_ups"]
-            }
-
-            # Generate follow-ups
-            result = await self.llm.generate_structured(
-                prompt=prompt,
-                output_schema=schema,
-                system_prompt="You are an expert interviewer skilled at asking insightful follow-up questions."
+        except Exception as e:
+            logger.error("Error generating follow-ups: %s", e, exc_info=True)
+            return []
+
+    async def _generate(
+        self,
+        original_question: Question,
+        response: str,
+        analysis: ResponseAnalysis,
+        context: Optional[Dict[str, Any]],
+        max_follow_ups: int,
+        include_rationale: bool,
+        cache_key: bytes
+    ) -> List[FollowUpQuestion]:
+        """Run one LLM generation and cache its follow-ups under cache_key"""
+        # Build generation prompt
+        prompt = self._build_generation_prompt(
+            original_question, response, analysis, context
+        )
+
+        # Define output schema
+        schema = _follow_up_schema(max_follow_ups, include_rationale)
+
+        # Generate follow-ups
+        generate = self.batcher.submit if self.batcher else self.llm.generate_structured
+        result = await generate(
+            prompt=prompt,
+            output_schema=schema,
+            system_prompt="You are an expert interviewer skilled at asking insightful follow-up questions."
+        )
+
+        # Convert to FollowUpQuestion objects
+        follow_ups = [
+            FollowUpQuestion(
+                question_text=fu["question_text"],
+                action_type=_parse_action(fu["action_type"]),
+                priority=fu["priority"],
+                reason=fu.get("reason", ""),
+                expected_insight=fu.get("expected_insight", "")
             )
+            for fu in result.get("follow_ups", [])
+        ]
 
-            # Convert to FollowUpQuestion objects
-            follow_ups = [
-                FollowUpQuestion(
-                    question_text=fu["question_text"],
-                    reason=fu["reason"],
-                    action_type=FollowUpAction(fu["action_type"]),
-                    priority=fu["priority"],
-                    expected_insight=fu.get("expected_insight", "")
-                )
-                for fu in result.get("follow_ups", [])
-            ]
-
-            # Sort by priority
-            follow_ups.sort(key=lambda x: x.priority, reverse=True)
-
-            logger.info(f"Generated {len(follow_ups)} follow-up questions")
-            return follow_ups
+        # Keep the highest-priority ones; the schema's maxItems is only a hint
+        follow_ups = heapq.nlargest(max_follow_ups, follow_ups, key=_BY_PRIORITY)
 
-        except Exception as e:
-            logger.error(f"Error generating follow-ups: {e}")
-            return []
+        self._cache[cache_key] = follow_ups
+
+        logger.info("Generated %d follow-up questions", len(follow_ups))
+        return follow_ups
+
+    async def get_follow_ups(
+        self,
+        question: Question,
+        response: str,
+        analysis: ResponseAnalysis,
+        context: Optional[Dict[str, Any]] = None,
+        max_follow_ups: int = 3,
+        include_rationale: bool = False,
+    ) -> List[FollowUpQuestion]:
+        """
+        Get follow-ups from trigger rules, topped up by LLM generation
+
+        Configured trigger templates are applied first; the LLM is only asked
+        for the slots they leave open, and not called at all when they fill
+        every slot.
+
+        Args:
+            question: The original question asked
+            response: The respondent's answer
+            analysis: Analysis of the response
+            context: Optional context (interview history, objectives, etc.)
+            max_follow_ups: Maximum number of follow-ups to return
+            include_rationale: Also have the LLM fill reason and expected_insight
+
+        Returns:
+            Follow-up questions, ranked by priority
+        """
+        rule_based = heapq.nlargest(
+            max_follow_ups,
+            await self.apply_trigger_rules(question, response, analysis),
+            key=_BY_PRIORITY
+        )
+        remaining = max_follow_ups - len(rule_based)
+        if remaining <= 0:
+            logger.debug("Trigger rules filled every follow-up slot")
+            return rule_based
+
+        generated = await self.generate_follow_ups(
+            question, response, analysis, context,
+            max_follow_ups=remaining, include_rationale=include_rationale
+        )
+        return heapq.nlargest(max_follow_ups, rule_based + generated, key=_BY_PRIORITY)
+
+    def _cache_key(
+        self,
+        original_question: Question,
+        response: str,
+        analysis: ResponseAnalysis,
+        context: Optional[Dict[str, Any]],
+        max_follow_ups: int,
+        include_rationale: bool
+    ) -> bytes:
+        """
+        Hash the generation inputs that shape the follow-ups
+
+        The answer is compared case- and whitespace-insensitively so that
+        canned answers ("I don't know") hit across interviews of the same
+        guide. Time remaining is in the prompt, so it is keyed by the minute
+        rather than left out.
+        """
+        context = context or {}
+        time_remaining = context.get("time_remaining")
+        payload = orjson.dumps([
+            original_question.id,
+            original_question.text,
+            " ".join(response.lower().split()),
+            analysis.sentiment.value,
+            round(analysis.information_density, 2),
+            sorted(analysis.themes),
+            sorted(analysis.signals),
+            analysis.contradictions,
+            analysis.requires_clarification,
+            context.get("research_objective"),
+            int(time_remaining // _TIME_REMAINING_BUCKET_SECONDS) if time_remaining else None,
+            max_follow_ups,
+            include_rationale,
+        ])
+        return hashlib.blake2b(payload, digest_size=16).digest()
 
     def _should_generate_follow_ups(
         self,
@@ -167,32 +529,18 @@ class FollowUpGenerator:
         Returns:
             True if follow-ups are warranted
         """
-        # Generate follow-ups if:
-        # 1. Response requires clarification
-        if analysis.requires_clarification:
-            return True
-
-        # 2. Low information density (vague answer)
-        if analysis.information_density < 0.4:
-            return True
-
-        # 3. Strong signals of interest (enthusiasm, emotion)
-        if any(signal in analysis.signals for signal in ["enthusiasm", "emotional"]):
-            return True
-
-        # 4. Contradictions detected
-        if analysis.contradictions:
-            return True
-
-        # 5. High information density (valuable, worth exploring more)
-        if analysis.information_density > 0.7:
-            return True
-
-        # 6. Question has configured follow-up triggers
-        if original_question.follow_up_triggers:
-            return True
-
-        return False
+        # Generate follow-ups if the response needs clarification, is vague
+        # (low density) or valuable (high density), shows interest signals or
+        # contradictions, or the question has configured follow-up triggers
+        density = analysis.information_density
+        return bool(
+            analysis.requires_clarification
+            or density < 0.4
+            or density > 0.7
+            or analysis.contradictions
+            or original_question.follow_up_triggers
+            or not _INTEREST_SIGNALS.isdisjoint(analysis.signals)
+        )
 
     def _build_generation_prompt(
         self,
@@ -202,7 +550,7 @@ class FollowUpGenerator:
         context: Optional[Dict[str, Any]] = None
     ) -> str:
         """Build prompt for follow-up generation"""
-        prompt = f"""Generate insightful follow-up questions for this interview response:
+        parts = [f"""Generate insightful follow-up questions for this interview response:
 
 **Original Question:**
 {original_question.text}
@@ -213,41 +561,23 @@ class FollowUpGenerator:
 **Analysis:**
 - Sentiment: {analysis.sentiment.value}
 - Information Density: {analysis.information_density:.2f}
-- Key Themes: {', '.join(analysis.themes)}
-- Signals: {', '.join(analysis.signals)}
+- Key Themes: {analysis.themes_str}
+- Signals: {analysis.signals_str}
 - Requires Clarification: {analysis.requires_clarification}
-"""
+"""]
 
         if analysis.contradictions:
-            prompt += f"\n- Contradictions: {', '.join(analysis.contradictions)}\n"
+            parts.append(f"\n- Contradictions: {', '.join(analysis.contradictions)}\n")
 
         if context:
             if context.get("research_objective"):
-                prompt += f"\n**Research Objective:**\n{context['research_objective']}\n"
+                parts.append(f"\n**Research Objective:**\n{context['research_objective']}\n")
 
             if context.get("time_remaining"):
-                prompt += f"\n**Time Remaining:** {context['time_remaining']} seconds\n"
-
-        prompt += """
-**Task:**
-Generate follow-up questions that will extract maximum insight value. Consider:
+                parts.append(f"\n**Time Remaining:** {context['time_remaining']} seconds\n")
 
-1. **DRILL_DEEPER**: Ask for more details on interesting points
-2. **PROBE**: Explore reasoning and motivations
-3. **CLARIFY**: Resolve vague or ambiguous statements
-4. **EXAMPLE**: Request concrete examples
-5. **COMPARE**: Compare with alternatives or past experiences
-
-For each follow-up:
-- Make it conversational and natural
-- Focus on uncovering deeper insights
-- Avoid yes/no questions
-- Prioritize questions that align with research objectives
-- Consider the time remaining
-
-Generate up to 3 follow-up questions, ranked by priority (most valuable first).
-"""
-        return prompt
+        parts.append(_TASK_SUFFIX)
+        return "".join(parts)
 
     async def apply_trigger_rules(
         self,
@@ -267,10 +597,16 @@ Generate up to 3 follow-up questions, ranked by priority (most valuable first).
             Follow-ups based on trigger rules
         """
         follow_ups = []
+        if not question.follow_up_triggers:
+            return follow_ups
+
+        # Shared by every condition check
+        response_lower = response.lower()
+        word_count = len(response.split())
 
         for trigger in question.follow_up_triggers:
             # Check if trigger condition is met
-            if self._check_trigger_condition(trigger.condition, response, analysis):
+            if _compile_condition(trigger.condition)(response_lower, word_count, analysis):
                 # Use template if available
                 if trigger.template:
                     follow_up = FollowUpQuestion(
@@ -283,44 +619,3 @@ Generate up to 3 follow-up questions, ranked by priority (most valuable first).
                     follow_ups.append(follow_up)
 
         return follow_ups
-
-    def _check_trigger_condition(
-        self,
-        condition: str,
-        response: str,
-        analysis: ResponseAnalysis
-    ) -> bool:
-        """
-        Check if a trigger condition is met
-
-        Args:
-            condition: Condition string (e.g., "vague_response", "enthusiasm")
-            response: Response text
-            analysis: Response analysis
-
-        Returns:
-            True if condition is met
-        """
-        condition_lower = condition.lower()
-
-        # Check for common trigger conditions
-        if "vague" in condition_lower:
-            return analysis.information_density < 0.4
-
-        if "enthusiasm" in condition_lower:
-            return "enthusiasm" in analysis.signals
-
-        if "hesitation" in condition_lower:
-            return "hesitation" in analysis.signals
-
-        if "short" in condition_lower:
-            return len(response.split()) < 20
-
-        if "detailed" in condition_lower or "long" in condition_lower:
-            return len(response.split()) > 100
-
-        if "negative" in condition_lower:
-            return "negative" in analysis.sentiment.value
-
-        # Default: check if condition keywords appear in response
-        return condition_lower in response.lower()
@@ -7,8 +7,10 @@ from typing import List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from collections import defaultdict, Counter
+import heapq
 import logging
 import json
+import numpy as np
 
 from ..models.interview import Interview, InterviewResponse
 from ..models.call_guide import FollowUpAction
@@ -16,6 +18,70 @@ from .llm_provider import LLMProvider
 
 logger = logging.getLogger(__name__)
 
+# Sentiment value -> row of _SENTIMENT_QUALITY; unknown sentiment uses the last row
+_SENTIMENT_CODES: Dict[str, int] = {
+    "very_positive": 0,
+    "positive": 1,
+    "neutral": 2,
+    "negative": 3,
+    "very_negative": 4
+}
+_SENTIMENT_QUALITY = np.array([1.0, 0.8, 0.7, 0.5, 0.3, np.nan])
+_NO_SENTIMENT = len(_SENTIMENT_CODES)
+
+# Responses this long get the full length score
+_FULL_LENGTH_WORDS = 50
+
+
+@dataclass
+class _ResponseColumns:
+    """Per-response quality inputs as parallel arrays (NaN where unknown)"""
+    word_counts: np.ndarray
+    information_density: np.ndarray
+    sentiment_codes: np.ndarray
+    theme_counts: np.ndarray
+
+
+def _vectorize_responses(responses: List[InterviewResponse]) -> _ResponseColumns:
+    """Collect the response attributes that feed the quality score, one pass"""
+    n = len(responses)
+    word_counts = np.empty(n)
+    density = np.empty(n)
+    sentiment_codes = np.empty(n, dtype=np.intp)
+    theme_counts = np.empty(n)
+    for i, response in enumerate(responses):
+        # The length score saturates, so stop splitting once it is full
+        word_counts[i] = len(response.response_text.split(maxsplit=_FULL_LENGTH_WORDS))
+        density[i] = (
+            np.nan if response.information_density is None else response.information_density
+        )
+        sentiment_codes[i] = (
+            _SENTIMENT_CODES[response.sentiment.value] if response.sentiment else _NO_SENTIMENT
+        )
+        theme_counts[i] = len(response.themes)
+    return _ResponseColumns(word_counts, density, sentiment_codes, theme_counts)
+
+
+def _response_quality(columns: _ResponseColumns) -> np.ndarray:
+    """
+    Quality score per response: the mean of the available factors
+
+    Length and theme scores are always present; density and sentiment count
+    only for responses that have them.
+    """
+    density = columns.information_density
+    sentiment = _SENTIMENT_QUALITY[columns.sentiment_codes]
+    has_density = ~np.isnan(density)
+    has_sentiment = ~np.isnan(sentiment)
+
+    total = (
+        np.minimum(1.0, columns.word_counts / _FULL_LENGTH_WORDS)
+        + np.where(has_density, density, 0.0)
+        + np.where(has_sentiment, sentiment, 0.0)
+        + np.minimum(1.0, columns.theme_counts / 3.0)
+    )
+    return total / (2 + has_density + has_sentiment)
+
 
 @dataclass
 class FollowUpOutcome:
@@ -100,9 +166,18 @@ class FollowUpLearningSystem:
             # Identify follow-up sequences
             sequences = self._identify_follow_up_sequences(interview)
 
+            # Score every response once, then look scores up per sequence
+            quality = (
+                _response_quality(_vectorize_responses(interview.responses)).tolist()
+                if sequences else []
+            )
+
             # Analyze each sequence
-            for sequence in sequences:
-                outcome = await self._analyze_follow_up_outcome(sequence)
+            for i in sequences:
+                outcome = await self._analyze_follow_up_outcome(
+                    (interview.responses[i], interview.responses[i + 1]),
+                    (quality[i], quality[i + 1])
+                )
                 if outcome:
                     self.outcomes.append(outcome)
 
@@ -123,19 +198,20 @@ class FollowUpLearningSystem:
     def _identify_follow_up_sequences(
         self,
         interview: Interview
-    ) -> List[Tuple[InterviewResponse, InterviewResponse]]:
-        """Identify follow-up question sequences in interview"""
+    ) -> List[int]:
+        """
+        Identify follow-up question sequences in interview
+
+        Returns:
+            Index of each original response whose next response follows it up
+        """
         sequences = []
 
         responses = interview.responses
         for i in range(len(responses) - 1):
-            current = responses[i]
-            next_response = responses[i + 1]
-
             # Check if next response is a follow-up
-            # (In a real system, this would be tracked explicitly)
-            if self._is_follow_up(current, next_response):
-                sequences.append((current, next_response))
+            if self._is_follow_up(responses[i], responses[i + 1]):
+                sequences.append(i)
 
         return sequences
 
@@ -145,23 +221,22 @@ class FollowUpLearningSystem:
         potential_follow_up: InterviewResponse
     ) -> bool:
         """Determine if a response is a follow-up to another"""
-        # Simple heuristic: check if questions are in same section and sequential
+        # The orchestrator records follow-ups with a link to their parent
         return (
-            original.section_name == potential_follow_up.section_name and
-            original.sequence_number + 1 == potential_follow_up.sequence_number
+            potential_follow_up.is_follow_up and
+            potential_follow_up.parent_response_id == original.response_id and
+            original.section_name == potential_follow_up.section_name
         )
 
     async def _analyze_follow_up_outcome(
         self,
-        sequence: Tuple[InterviewResponse, InterviewResponse]
+        sequence: Tuple[InterviewResponse, InterviewResponse],
+        qualities: Tuple[float, float]
     ) -> Optional[FollowUpOutcome]:
         """Analyze the outcome of a follow-up question"""
         try:
             original, follow_up = sequence
-
-            # Calculate response quality scores
-            original_quality = self._calculate_response_quality(original)
-            follow_up_quality = self._calculate_response_quality(follow_up)
+            original_quality, follow_up_quality = qualities
 
             # Calculate improvement
             improvement = follow_up_quality - original_quality
@@ -193,39 +268,6 @@ class FollowUpLearningSystem:
             logger.error(f"Error analyzing follow-up outcome: {e}")
             return None
 
-    def _calculate_response_quality(self, response: InterviewResponse) -> float:
-        """Calculate quality score for a response"""
-        # Combine multiple quality indicators
-        factors = []
-
-        # Length (normalized)
-        word_count = len(response.response_text.split())
-        length_score = min(1.0, word_count / 50.0)  # 50 words = full score
-        factors.append(length_score)
-
-        # Information density from metadata
-        if "information_density" in response.analysis_metadata:
-            factors.append(response.analysis_metadata["information_density"])
-
-        # Sentiment (neutral to positive is good)
-        if response.sentiment:
-            sentiment_map = {
-                "very_positive": 1.0,
-                "positive": 0.8,
-                "neutral": 0.7,
-                "negative": 0.5,
-                "very_negative": 0.3
-            }
-            sentiment_score = sentiment_map.get(response.sentiment.value, 0.7)
-            factors.append(sentiment_score)
-
-        # Theme count (more themes = richer response)
-        theme_score = min(1.0, len(response.themes) / 3.0)
-        factors.append(theme_score)
-
-        # Average all factors
-        return sum(factors) / len(factors) if factors else 0.5
-
     def _infer_follow_up_action(
         self,
         original: InterviewResponse,
@@ -312,11 +354,11 @@ class FollowUpLearningSystem:
         effective_actions = [action for action, _ in action_counts.most_common(3)]
 
         # Get best examples
-        best_outcomes = sorted(
-            [o for o in outcomes if o.success],
-            key=lambda x: x.improvement_score,
-            reverse=True
-        )[:3]
+        best_outcomes = heapq.nlargest(
+            3,
+            (o for o in outcomes if o.success),
+            key=lambda x: x.improvement_score
+        )
         best_examples = [o.follow_up_question for o in best_outcomes]
 
         # Generate pattern type name
@@ -460,11 +502,11 @@ Make it natural, conversational, and likely to elicit a better response.
                 }
 
         # Top patterns
-        top_patterns = sorted(
+        top_patterns = heapq.nlargest(
+            5,
             self.patterns.values(),
-            key=lambda p: p.success_rate * p.sample_count,
-            reverse=True
-        )[:5]
+            key=lambda p: p.success_rate * p.sample_count
+        )
 
         report["top_patterns"] = [
             {
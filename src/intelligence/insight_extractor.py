@@ -3,6 +3,7 @@ Insight Extractor - Extracts and synthesizes insights from interviews
 """
 
 from typing import List, Dict, Any, Optional
+import heapq
 import logging
 from ..models.analytics import (
     InsightExtraction, Insight, Theme, SentimentTrajectory,
@@ -369,16 +370,17 @@ Provide a comprehensive synthesis that would be valuable for decision-making.
             variance = 0.0
 
         # Identify peaks
-        positive_peaks = sorted(
-            [dp for dp in data_points if dp.sentiment_score > 0.5],
-            key=lambda x: x.sentiment_score,
-            reverse=True
-        )[:3]
-
-        negative_peaks = sorted(
-            [dp for dp in data_points if dp.sentiment_score < -0.5],
+        positive_peaks = heapq.nlargest(
+            3,
+            (dp for dp in data_points if dp.sentiment_score > 0.5),
             key=lambda x: x.sentiment_score
-        )[:3]
+        )
+
+        negative_peaks = heapq.nsmallest(
+            3,
+            (dp for dp in data_points if dp.sentiment_score < -0.5),
+            key=lambda x: x.sentiment_score
+        )
 
         return SentimentTrajectory(
             interview_id=interview.interview_id,
@@ -3,9 +3,13 @@ LLM provider abstraction for response analysis and generation
 """
 
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from typing import List, Dict, Any, Optional
 from dataclasses import dataclass
+import asyncio
+import hashlib
 import logging
+import orjson
 from anthropic import Anthropic, AsyncAnthropic
 
 logger = logging.getLogger(__name__)
@@ -70,6 +74,44 @@ class LLMProvider(ABC):
         """
         pass
 
+    async def generate_structured_batch(
+        self,
+        prompts: List[str],
+        output_schema: Dict[str, Any],
+        system_prompt: Optional[str] = None,
+        **kwargs,
+    ) -> List[Any]:
+        """
+        Generate structured output for several prompts sharing one schema
+
+        Providers without a native batch endpoint run the distinct prompts
+        concurrently; identical prompts are generated once.
+
+        Args:
+            prompts: User prompts
+            output_schema: JSON schema for every output
+            system_prompt: System prompt
+            **kwargs: Additional arguments
+
+        Returns:
+            Results aligned with prompts; a failed prompt's slot holds its exception
+        """
+        unique_prompts = list(dict.fromkeys(prompts))
+        results = await asyncio.gather(
+            *(
+                self.generate_structured(
+                    prompt=prompt,
+                    output_schema=output_schema,
+                    system_prompt=system_prompt,
+                    **kwargs,
+                )
+                for prompt in unique_prompts
+            ),
+            return_exceptions=True,
+        )
+        by_prompt = dict(zip(unique_prompts, results))
+        return [by_prompt[prompt] for prompt in prompts]
+
 
 class ClaudeProvider(LLMProvider):
     """Anthropic Claude LLM provider"""
@@ -165,27 +207,27 @@ class ClaudeProvider(LLMProvider):
         Returns:
             Parsed JSON output
         """
-        import json
-
-        # Enhance prompt with schema
-        enhanced_prompt = f"""{prompt}
-
-Please respond with a valid JSON object matching this schema:
-{json.dumps(output_schema, indent=2)}
+        # The schema is as static as the system prompt, so append it there
+        # and keep the user message limited to the per-call input
+        schema_instructions = f"""Please respond with a valid JSON object matching this schema:
+{orjson.dumps(output_schema, option=orjson.OPT_INDENT_2).decode()}
 
 Respond with ONLY the JSON object, no additional text."""
+        enhanced_system_prompt = (
+            f"{system_prompt}\n\n{schema_instructions}" if system_prompt else schema_instructions
+        )
 
         response = await self.generate(
-            prompt=enhanced_prompt,
-            system_prompt=system_prompt,
+            prompt=prompt,
+            system_prompt=enhanced_system_prompt,
             temperature=0.3,  # Lower temperature for structured output
             **kwargs,
         )
 
         try:
             # Parse JSON from response
-            return json.loads(response.content)
-        except json.JSONDecodeError as e:
+            return orjson.loads(response.content)
+        except orjson.JSONDecodeError as e:
             logger.error(f"Failed to parse JSON from Claude response: {e}")
             logger.error(f"Response content: {response.content}")
             raise
@@ -222,6 +264,148 @@ class MockLLMProvider(LLMProvider):
         return {"mock": "structured_output", "prompt": prompt[:30]}
 
 
+class CachedLLMProvider(LLMProvider):
+    """
+    LLM provider wrapper that memoizes deterministic calls
+
+    Structured calls are cached by default; free-text generation is cached
+    only at temperature 0, where repeated prompts yield the same output.
+    Cached results are shared between callers and must not be mutated.
+    """
+
+    def __init__(
+        self,
+        provider: LLMProvider,
+        max_entries: int = 1024,
+        cache_structured: bool = True,
+    ):
+        """
+        Initialize cached provider
+
+        Args:
+            provider: Provider to delegate cache misses to
+            max_entries: Maximum cached responses (least recently used evicted)
+            cache_structured: Whether to cache generate_structured results
+        """
+        self.provider = provider
+        self.max_entries = max_entries
+        self.cache_structured = cache_structured
+        self._cache: OrderedDict = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    def _cache_key(self, kind: str, prompt: str, **params: Any) -> str:
+        """Hash a call's inputs, collapsing whitespace in the prompt"""
+        payload = orjson.dumps(
+            {
+                "kind": kind,
+                "model": getattr(self.provider, "model", None),
+                "prompt": " ".join(prompt.split()),
+                **params,
+            },
+            option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS,
+            default=str,
+        )
+        return hashlib.sha256(payload).hexdigest()
+
+    def _get(self, key: str) -> Any:
+        """Look up a cached response, refreshing its recency"""
+        if key in self._cache:
+            self._hits += 1
+            self._cache.move_to_end(key)
+            return self._cache[key]
+
+        self._misses += 1
+        return None
+
+    def _put(self, key: str, value: Any):
+        """Store a response, evicting the least recently used entry"""
+        self._cache[key] = value
+        if len(self._cache) > self.max_entries:
+            self._cache.popitem(last=False)
+
+    def cache_stats(self) -> Dict[str, Any]:
+        """Get cache hit/miss counters"""
+        total = self._hits + self._misses
+        return {
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_rate": self._hits / total if total else 0.0,
+            "size": len(self._cache),
+        }
+
+    def clear_cache(self):
+        """Drop all cached responses"""
+        self._cache.clear()
+
+    async def generate(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None,
+        **kwargs,
+    ) -> LLMResponse:
+        """Generate a response, serving temperature-0 calls from cache"""
+        # Forward max_tokens only when given so the provider's default applies
+        if max_tokens is not None:
+            kwargs["max_tokens"] = max_tokens
+
+        if temperature != 0:
+            return await self.provider.generate(
+                prompt=prompt,
+                system_prompt=system_prompt,
+                temperature=temperature,
+                **kwargs,
+            )
+
+        key = self._cache_key("generate", prompt, system=system_prompt, kwargs=kwargs)
+        cached = self._get(key)
+        if cached is not None:
+            return cached
+
+        response = await self.provider.generate(
+            prompt=prompt,
+            system_prompt=system_prompt,
+            temperature=temperature,
+            **kwargs,
+        )
+        self._put(key, response)
+        return response
+
+    async def generate_structured(
+        self,
+        prompt: str,
+        output_schema: Dict[str, Any],
+        system_prompt: Optional[str] = None,
+        **kwargs,
+    ) -> Dict[str, Any]:
+        """Generate structured output, serving repeated calls from cache"""
+        if not self.cache_structured:
+            return await self.provider.generate_structured(
+                prompt=prompt,
+                output_schema=output_schema,
+                system_prompt=system_prompt,
+                **kwargs,
+            )
+
+        key = self._cache_key(
+            "structured", prompt, schema=output_schema, system=system_prompt, kwargs=kwargs
+        )
+        cached = self._get(key)
+        if cached is not None:
+            return cached
+
+        result = await self.provider.generate_structured(
+            prompt=prompt,
+            output_schema=output_schema,
+            system_prompt=system_prompt,
+            **kwargs,
+        )
+        self._put(key, result)
+        return result
+
+
 def create_llm_provider(
     provider: str = "claude",
     api_key: Optional[str] = None,
@@ -4,6 +4,7 @@ Response Analyzer - Analyzes respondent answers using LLM
 
 from typing import Dict, Any, List, Optional
 from dataclasses import dataclass
+from functools import cached_property
 import logging
 from ..models.interview import ResponseSentiment, InterviewResponse
 from .llm_provider import LLMProvider
@@ -24,6 +25,18 @@ class ResponseAnalysis:
     contradictions: List[str]
     notable_content: str  # Brief summary of what makes this response valuable
 
+    # Prompt fragments; computed on first use, so themes and signals should
+    # not be modified afterwards
+    @cached_property
+    def themes_str(self) -> str:
+        """Themes as a comma-separated string"""
+        return ', '.join(self.themes)
+
+    @cached_property
+    def signals_str(self) -> str:
+        """Signals as a comma-separated string"""
+        return ', '.join(self.signals)
+
 
 class ResponseAnalyzer:
     """Analyzes interview responses using LLM"""
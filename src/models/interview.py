@@ -63,6 +63,11 @@ class InterviewResponse(BaseModel):
     requires_clarification: bool = Field(default=False)
     flags: List[str] = Field(default_factory=list)
 
+    @property
+    def word_count(self) -> int:
+        """Number of whitespace-separated words in the response text"""
+        return len(self.response_text.split())
+
 
 class TranscriptEntry(BaseModel):
     """Single entry in interview transcript"""
@@ -101,6 +106,7 @@ class QualityMetrics(BaseModel):
     questions_answered: int = 0
     follow_ups_generated: int = 0
     insight_yield: float = Field(default=0, description="Valuable findings per minute")
+    response_quality_average: float = Field(default=0, ge=0.0, le=1.0)
     guide_adherence: float = Field(default=0, ge=0.0, le=1.0)
     technical_quality_score: float = Field(default=0, ge=0.0, le=1.0)
     stt_accuracy: Optional[float] = Field(default=None, ge=0.0, le=1.0)
@@ -3,19 +3,28 @@ Quality Monitoring System
 Real-time quality metrics tracking and alerting
 """
 
-from typing import List, Dict, Any, Optional, Callable
+from typing import List, Dict, Any, Optional, Callable, Iterable
 from dataclasses import dataclass, field
 from enum import Enum
 from datetime import datetime, timedelta
 import logging
 from collections import deque
+from itertools import islice
 import asyncio
 
+import numpy as np
+
 from ..models.interview import Interview, InterviewResponse
 from ..models.analytics import TrendAnalysis
 
 logger = logging.getLogger(__name__)
 
+# Interview statuses interned to small ints for the column store
+STATUS_OTHER = 0
+STATUS_COMPLETED = 1
+STATUS_FAILED = 2
+_STATUS_CODES = {"completed": STATUS_COMPLETED, "failed": STATUS_FAILED}
+
 
 class AlertSeverity(str, Enum):
     """Alert severity levels"""
@@ -45,7 +54,7 @@ class QualityThreshold:
     enabled: bool = True
 
 
-@dataclass
+@dataclass(slots=True)
 class QualityAlert:
     """Quality alert"""
     alert_id: str
@@ -61,7 +70,7 @@ class QualityAlert:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class MetricSnapshot:
     """Snapshot of a metric at a point in time"""
     metric_name: str
@@ -105,6 +114,39 @@ class QualityReport:
     recommendations: List[str]
 
 
+class NumericRingBuffer:
+    """Fixed-capacity ring of (timestamp, value) pairs backed by numpy arrays"""
+
+    def __init__(self, capacity: int):
+        """
+        Initialize ring buffer
+
+        Args:
+            capacity: Maximum number of points retained
+        """
+        self.capacity = capacity
+        self.values = np.zeros(capacity, dtype=np.float64)
+        self.timestamps = np.zeros(capacity, dtype=np.float64)
+        self.count = 0
+
+    def __len__(self) -> int:
+        return min(self.count, self.capacity)
+
+    def append(self, value: float, timestamp: float):
+        """Append a point, overwriting the oldest once full"""
+        idx = self.count % self.capacity
+        self.values[idx] = value
+        self.timestamps[idx] = timestamp
+        self.count += 1
+
+    def ordered_values(self) -> np.ndarray:
+        """Values oldest first"""
+        if self.count <= self.capacity:
+            return self.values[:self.count]
+        head = self.count % self.capacity
+        return np.concatenate((self.values[head:], self.values[:head]))
+
+
 class QualityMonitor:
     """Real-time quality monitoring system"""
 
@@ -121,22 +163,46 @@ class QualityMonitor:
             alert_callback: Optional callback function for alerts
         """
         self.thresholds = thresholds or self._default_thresholds()
+        self.thresholds_by_name: Dict[str, QualityThreshold] = {
+            t.metric_name: t for t in self.thresholds
+        }
         self.alert_callback = alert_callback
 
-        # Storage for metrics and alerts
+        # Storage for metrics and alerts: snapshots keep per-point metadata,
+        # metric_series mirrors their values for vectorized reductions
         self.metric_history: Dict[str, deque] = {}
-        self.active_alerts: List[QualityAlert] = []
+        self.metric_series: Dict[str, NumericRingBuffer] = {}
+        self.active_alerts: deque = deque(maxlen=1000)
         self.alert_history: deque = deque(maxlen=1000)
 
+        # Severity indexes: history per severity, and unresolved active
+        # alerts per severity keyed by alert_id
+        self._alerts_by_severity: Dict[AlertSeverity, deque] = {
+            severity: deque(maxlen=self.alert_history.maxlen)
+            for severity in AlertSeverity
+        }
+        self._active_alerts_by_severity: Dict[AlertSeverity, Dict[str, QualityAlert]] = {
+            severity: {} for severity in AlertSeverity
+        }
+
         # Interview tracking
         self.interviews_in_progress: Dict[str, Interview] = {}
         self.completed_interviews: deque = deque(maxlen=100)
 
+        # Column-oriented ring of completed interview stats, parallel to
+        # completed_interviews, so windowed aggregates are vectorized
+        capacity = self.completed_interviews.maxlen
+        self._completed_count = 0
+        self._col_completed_at = np.full(capacity, -np.inf, dtype=np.float64)
+        self._col_duration = np.zeros(capacity, dtype=np.float64)
+        self._col_engagement = np.zeros(capacity, dtype=np.float64)
+        self._col_completion = np.zeros(capacity, dtype=np.float64)
+        self._col_quality = np.zeros(capacity, dtype=np.float64)
+        self._col_status = np.zeros(capacity, dtype=np.uint8)
+
         # Initialize metric history
         for threshold in self.thresholds:
-            self.metric_history[threshold.metric_name] = deque(
-                maxlen=threshold.window_size
-            )
+            self.ensure_metric_history(threshold.metric_name, threshold.window_size)
 
         logger.info("Initialized QualityMonitor")
 
@@ -229,9 +295,7 @@ class QualityMonitor:
                 )
 
                 # Add to history
-                if metric_name not in self.metric_history:
-                    self.metric_history[metric_name] = deque(maxlen=100)
-                self.metric_history[metric_name].append(snapshot)
+                self._record_snapshot(snapshot)
 
                 # Check thresholds
                 await self._check_threshold(snapshot)
@@ -253,6 +317,7 @@ class QualityMonitor:
 
             # Add to completed
             self.completed_interviews.append(interview)
+            self._record_completion_columns(interview)
 
             # Calculate and track final metrics
             metrics = self._extract_interview_metrics(interview)
@@ -265,9 +330,7 @@ class QualityMonitor:
                     status=self._determine_status(metric_name, value)
                 )
 
-                if metric_name not in self.metric_history:
-                    self.metric_history[metric_name] = deque(maxlen=100)
-                self.metric_history[metric_name].append(snapshot)
+                self._record_snapshot(snapshot)
 
                 await self._check_threshold(snapshot)
 
@@ -276,20 +339,92 @@ class QualityMonitor:
         except Exception as e:
             logger.error(f"Error tracking interview completion: {e}")
 
+    def _record_completion_columns(self, interview: Interview):
+        """Write a completed interview's stats into the column ring"""
+        idx = self._completed_count % len(self._col_status)
+        self._col_completed_at[idx] = (
+            interview.completed_at.timestamp() if interview.completed_at else -np.inf
+        )
+        # Failed interviews have no duration; NaN keeps them out of duration stats
+        self._col_duration[idx] = (
+            interview.duration_seconds / 60.0
+            if interview.duration_seconds is not None else np.nan
+        )
+        self._col_engagement[idx] = interview.engagement_metrics.overall_engagement
+        self._col_completion[idx] = interview.quality_metrics.completion_percentage
+        self._col_quality[idx] = interview.quality_metrics.response_quality_average
+        self._col_status[idx] = _STATUS_CODES.get(interview.status, STATUS_OTHER)
+        self._completed_count += 1
+
+    def get_completed_columns(self, cutoff_time: datetime) -> Dict[str, np.ndarray]:
+        """
+        Get column arrays for interviews completed after the cutoff
+
+        Args:
+            cutoff_time: Only interviews completed after this time are included
+
+        Returns:
+            Dict of equal-length arrays: duration_minutes (NaN where
+            unknown), engagement, completion, quality and status (STATUS_* codes)
+        """
+        filled = min(self._completed_count, len(self._col_status))
+        mask = self._col_completed_at[:filled] > cutoff_time.timestamp()
+
+        return {
+            "duration_minutes": self._col_duration[:filled][mask],
+            "engagement": self._col_engagement[:filled][mask],
+            "completion": self._col_completion[:filled][mask],
+            "quality": self._col_quality[:filled][mask],
+            "status": self._col_status[:filled][mask],
+        }
+
+    def ensure_metric_history(self, metric_name: str, window_size: int = 100):
+        """
+        Create bounded history storage for a metric if it does not exist
+
+        Args:
+            metric_name: Metric name
+            window_size: Number of points retained
+        """
+        if metric_name not in self.metric_history:
+            self.metric_history[metric_name] = deque(maxlen=window_size)
+            self.metric_series[metric_name] = NumericRingBuffer(window_size)
+
+    def _record_snapshot(self, snapshot: MetricSnapshot):
+        """Append a snapshot to its metric history and numeric series"""
+        self.ensure_metric_history(snapshot.metric_name)
+        self.metric_history[snapshot.metric_name].append(snapshot)
+        self.metric_series[snapshot.metric_name].append(
+            snapshot.value, snapshot.timestamp.timestamp()
+        )
+
+    def add_threshold(self, threshold: QualityThreshold):
+        """
+        Register a new threshold
+
+        Args:
+            threshold: Threshold to monitor
+        """
+        self.thresholds.append(threshold)
+        self.thresholds_by_name[threshold.metric_name] = threshold
+
     def _extract_interview_metrics(self, interview: Interview) -> Dict[str, float]:
         """Extract metrics from completed interview"""
         metrics = {
             "completion_rate": interview.quality_metrics.completion_percentage,
             "engagement_score": interview.engagement_metrics.overall_engagement,
             "response_quality": interview.quality_metrics.response_quality_average,
-            "duration_minutes": interview.duration_seconds / 60.0,
             "response_count": len(interview.responses),
         }
 
+        # Failed interviews end without a duration
+        if interview.duration_seconds is not None:
+            metrics["duration_minutes"] = interview.duration_seconds / 60.0
+
         # Calculate average information density
         if interview.responses:
             avg_density = sum(
-                r.analysis_metadata.get("information_density", 0.5)
+                r.information_density if r.information_density is not None else 0.5
                 for r in interview.responses
             ) / len(interview.responses)
             metrics["information_density"] = avg_density
@@ -300,10 +435,7 @@ class QualityMonitor:
         """Check if metric violates threshold"""
         try:
             # Find threshold for this metric
-            threshold = next(
-                (t for t in self.thresholds if t.metric_name == snapshot.metric_name),
-                None
-            )
+            threshold = self.thresholds_by_name.get(snapshot.metric_name)
 
             if not threshold or not threshold.enabled:
                 return
@@ -399,8 +531,14 @@ class QualityMonitor:
 
     async def _raise_alert(self, alert: QualityAlert):
         """Raise a quality alert"""
+        if len(self.active_alerts) == self.active_alerts.maxlen:
+            evicted = self.active_alerts[0]
+            self._active_alerts_by_severity[evicted.severity].pop(evicted.alert_id, None)
+
         self.active_alerts.append(alert)
         self.alert_history.append(alert)
+        self._alerts_by_severity[alert.severity].append(alert)
+        self._active_alerts_by_severity[alert.severity][alert.alert_id] = alert
 
         logger.warning(f"Quality Alert [{alert.severity.value}]: {alert.message}")
 
@@ -416,10 +554,7 @@ class QualityMonitor:
 
     def _determine_status(self, metric_name: str, value: float) -> MetricStatus:
         """Determine status for a metric value"""
-        threshold = next(
-            (t for t in self.thresholds if t.metric_name == metric_name),
-            None
-        )
+        threshold = self.thresholds_by_name.get(metric_name)
 
         if not threshold:
             return MetricStatus.UNKNOWN
@@ -455,33 +590,19 @@ class QualityMonitor:
         if time_window is None:
             time_window = timedelta(hours=1)
 
-        cutoff_time = datetime.utcnow() - time_window
-
-        # Filter recent completed interviews
-        recent_interviews = [
-            i for i in self.completed_interviews
-            if i.completed_at and i.completed_at > cutoff_time
-        ]
-
-        # Calculate statistics
-        total = len(recent_interviews)
-        completed = len([i for i in recent_interviews if i.status == "completed"])
-        failed = len([i for i in recent_interviews if i.status == "failed"])
+        now = datetime.utcnow()
+        cutoff_time = now - time_window
 
-        avg_completion = (
-            sum(i.quality_metrics.completion_percentage for i in recent_interviews) / total
-            if total > 0 else 0.0
-        )
+        # Vectorized statistics over the window
+        columns = self.get_completed_columns(cutoff_time)
+        total = len(columns["status"])
+        status_counts = np.bincount(columns["status"], minlength=STATUS_FAILED + 1)
+        completed = int(status_counts[STATUS_COMPLETED])
+        failed = int(status_counts[STATUS_FAILED])
 
-        avg_engagement = (
-            sum(i.engagement_metrics.overall_engagement for i in recent_interviews) / total
-            if total > 0 else 0.0
-        )
-
-        avg_quality = (
-            sum(i.quality_metrics.response_quality_average for i in recent_interviews) / total
-            if total > 0 else 0.0
-        )
+        avg_completion = float(columns["completion"].mean()) if total > 0 else 0.0
+        avg_engagement = float(columns["engagement"].mean()) if total > 0 else 0.0
+        avg_quality = float(columns["quality"].mean()) if total > 0 else 0.0
 
         # Get current metric snapshots
         snapshots = []
@@ -501,7 +622,8 @@ class QualityMonitor:
         health_score = self._calculate_health_score(snapshots)
 
         # Identify issues
-        issues = self._identify_issues(recent_interviews, snapshots)
+        completion_rate = completed / total if total > 0 else None
+        issues = self._identify_issues(completion_rate, snapshots)
 
         # Generate recommendations
         recommendations = self._generate_recommendations(issues, trends)
@@ -513,8 +635,8 @@ class QualityMonitor:
         ]
 
         report = QualityReport(
-            report_id=f"qr_{datetime.utcnow().isoformat()}",
-            generated_at=datetime.utcnow(),
+            report_id=f"qr_{now.isoformat()}",
+            generated_at=now,
             time_window=time_window,
             overall_status=overall_status,
             health_score=health_score,
@@ -537,13 +659,13 @@ class QualityMonitor:
         """Calculate trends for all metrics"""
         trends = {}
 
-        for metric_name, history in self.metric_history.items():
-            if len(history) >= 3:
-                values = [s.value for s in history]
+        for metric_name, series in self.metric_series.items():
+            if len(series) >= 3:
+                values = series.ordered_values()
 
                 # Simple trend calculation
-                recent_avg = sum(values[-3:]) / 3
-                older_avg = sum(values[:3]) / 3
+                recent_avg = float(values[-3:].mean())
+                older_avg = float(values[:3].mean())
 
                 diff = recent_avg - older_avg
                 threshold = older_avg * 0.1  # 10% change
@@ -607,7 +729,7 @@ class QualityMonitor:
 
     def _identify_issues(
         self,
-        interviews: List[Interview],
+        completion_rate: Optional[float],
         snapshots: List[MetricSnapshot]
     ) -> List[str]:
         """Identify current issues"""
@@ -626,10 +748,7 @@ class QualityMonitor:
                 issues.append(f"{alert.metric_name}: {alert.message}")
 
         # Check completion rate
-        if interviews:
-            completion_rate = sum(
-                1 for i in interviews if i.status == "completed"
-            ) / len(interviews)
+        if completion_rate is not None:
             if completion_rate < 0.7:
                 issues.append(f"Low completion rate: {completion_rate*100:.1f}%")
 
@@ -679,6 +798,7 @@ class QualityMonitor:
         for alert in self.active_alerts:
             if alert.alert_id == alert_id:
                 alert.resolved = True
+                self._active_alerts_by_severity[alert.severity].pop(alert.alert_id, None)
                 alert.metadata["resolved_by"] = resolved_by
                 alert.metadata["resolved_at"] = datetime.utcnow().isoformat()
                 logger.info(f"Alert {alert_id} resolved by {resolved_by}")
@@ -693,20 +813,40 @@ class QualityMonitor:
         if metric_name not in self.metric_history:
             return []
 
-        history = list(self.metric_history[metric_name])
-        if limit:
-            history = history[-limit:]
+        history = self.metric_history[metric_name]
+        if limit and limit < len(history):
+            return list(islice(history, len(history) - limit, None))
+
+        return list(history)
+
+    def iter_alerts(
+        self,
+        severity: Optional[AlertSeverity] = None,
+        include_resolved: bool = False
+    ) -> Iterable[QualityAlert]:
+        """
+        Iterate alerts, using the severity indexes when filtering
+
+        Args:
+            severity: Only alerts of this severity
+            include_resolved: Read from full alert history instead of
+                unresolved active alerts
+
+        Returns:
+            Iterable of matching alerts, oldest first
+        """
+        if include_resolved:
+            if severity:
+                return self._alerts_by_severity[severity]
+            return self.alert_history
 
-        return history
+        if severity:
+            return self._active_alerts_by_severity[severity].values()
+        return (a for a in self.active_alerts if not a.resolved)
 
     def get_active_alerts(
         self,
         severity: Optional[AlertSeverity] = None
     ) -> List[QualityAlert]:
         """Get active alerts, optionally filtered by severity"""
-        alerts = [a for a in self.active_alerts if not a.resolved]
-
-        if severity:
-            alerts = [a for a in alerts if a.severity == severity]
-
-        return alerts
+        return list(self.iter_alerts(severity))
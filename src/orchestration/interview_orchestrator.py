@@ -355,8 +355,8 @@ class InterviewOrchestrator:
         }
 
         # Generate follow-ups
-        follow_ups = await self.follow_up_generator.generate_follow_ups(
-            original_question=original_question,
+        follow_ups = await self.follow_up_generator.get_follow_ups(
+            question=original_question,
             response=response,
             analysis=analysis,
             context=context,
@@ -525,7 +525,7 @@ class InterviewOrchestrator:
         )
 
         # Engagement metrics
-        response_lengths = [len(r.response_text.split()) for r in responses if r.response_text]
+        response_lengths = [r.word_count for r in responses if r.response_text]
         if response_lengths:
             interview.engagement_metrics.avg_response_length = sum(response_lengths) / len(response_lengths)
 